@@ -0,0 +1,129 @@
+"""
+AssetManager class to load the game's images and fonts once.
+This module loads every image a single time, converts it to the display's
+pixel format so blits and rotations don't convert pixels on every call,
+caches scaled variants and fonts by key, can decode images on a background
+thread and records how long each load took.
+"""
+
+import threading
+import time
+
+import pygame
+
+
+class AssetError(Exception):
+    """An asset could not be loaded."""
+
+
+class AssetManager:
+    """Load, convert and cache images shared by the whole game."""
+
+    def __init__(self):
+        """Initialize empty caches."""
+        self._images = {}  # Path -> converted surface
+        self._scaled = {}  # (path, size) -> scaled surface
+        self._fonts = {}  # (name, size) -> font
+        self._pending = {}  # Path -> event set once its background decode is done
+        self._decoded = {}  # Path -> (image, seconds) or the AssetError of a background decode
+        self.load_times = {}  # Path -> seconds spent loading and converting
+        self.wait_time = 0.0  # Seconds get_image() waited for background decodes
+        self._loaders = []  # Background decode threads
+
+    def preload(self, paths):
+        """Start decoding the images at paths on a background thread.
+
+        get_image() picks them up (waiting only if a decode hasn't finished)
+        and converts them on the calling thread, which owns the display.
+        """
+        jobs = [(path, threading.Event()) for path in paths
+                if path not in self._images and path not in self._pending]
+        if not jobs:
+            return
+        self._pending.update(jobs)
+        loader = threading.Thread(target=self._decode_all, args=(jobs,), name='asset-loader',
+                                  daemon=True)
+        loader.start()
+        self._loaders.append(loader)
+
+    def get_image(self, path):
+        """Return the image at path, loading and converting it on first use.
+
+        Raises AssetError if the file is missing or can't be decoded.
+        """
+        image = self._images.get(path)
+        if image is None:
+            done = self._pending.pop(path, None)
+            if done is not None:
+                start = time.perf_counter()
+                done.wait()
+                self.wait_time += time.perf_counter() - start
+                result = self._decoded.pop(path)
+                if isinstance(result, AssetError):
+                    raise result
+                image, seconds = result
+            else:
+                image, seconds = self._decode(path)
+            start = time.perf_counter()
+            if pygame.display.get_surface() is not None:
+                # Converting needs a display mode; without one the raw image is kept
+                image = image.convert_alpha()
+            self._images[path] = image
+            self.load_times[path] = seconds + time.perf_counter() - start
+        return image
+
+    def close(self):
+        """Wait for the background decodes to finish."""
+        for loader in self._loaders:
+            loader.join()
+        self._loaders = []
+
+    def _decode_all(self, jobs):
+        """Decode every (path, event) job in turn, setting its event when done."""
+        for path, done in jobs:
+            try:
+                self._decoded[path] = self._decode(path)
+            except AssetError as e:
+                self._decoded[path] = e
+            done.set()
+
+    def _decode(self, path):
+        """Load the image file at path; return it and the seconds it took."""
+        start = time.perf_counter()
+        try:
+            image = pygame.image.load(path)
+        except (pygame.error, FileNotFoundError) as e:
+            raise AssetError(f"Could not load {path}: {e}") from e
+        return image, time.perf_counter() - start
+
+    def get_scaled(self, path, size):
+        """Return the image at path scaled to size (width, height), cached by both."""
+        key = (path, size)
+        image = self._scaled.get(key)
+        if image is None:
+            image = pygame.transform.scale(self.get_image(path), size)
+            self._scaled[key] = image
+        return image
+
+    def get_font(self, size, name=None):
+        """Return the font name (None = pygame's default) at size, shared by every caller."""
+        key = (name, size)
+        font = self._fonts.get(key)
+        if font is None:
+            font = self._fonts[key] = pygame.font.Font(name, size)
+        return font
+
+    def get_total_load_time(self):
+        """Get the seconds spent loading every image so far."""
+        return sum(self.load_times.values())
+
+    def get_report(self):
+        """Get a summary of the cached images and their load times."""
+        return {
+            'images': len(self._images),
+            'scaled_variants': len(self._scaled),
+            'fonts': len(self._fonts),
+            'load_ms': {path: seconds * 1000 for path, seconds in self.load_times.items()},
+            'total_load_ms': self.get_total_load_time() * 1000,
+            'wait_ms': self.wait_time * 1000
+        }
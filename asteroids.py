@@ -1,10 +1,27 @@
+import argparse
+import os
+import random
 import sys
+import time
 import pygame
 from settings import Settings
+from settings_profiles import ProfileWatcher, SettingsError, RESTART_ONLY, load_settings, resolve_profile
+from assets import AssetManager
+from event_log import EventLog, LEVELS, INFO, WARNING, ERROR
+from score_store import ScoreStore
+from sound import SoundBank, init_mixer
 from ship import Ship
 from bullet import Bullet
 from rock import Rock
 from game_stats import GameStats
+from spatial_hash import SpatialHash
+from renderer import DirtyRectRenderer
+from physics import create_physics
+from pool import EntityPool
+from entity import EntityGroup
+from spawner import SpawnScheduler
+from profiler import FrameProfiler, StartupTimer
+from replay import InputRecorder, run_replay
 from scoreboard import Scoreboard
 from button import StartScreen, GameOverScreen
 import ship
@@ -12,59 +29,325 @@ import ship
 class Asteroids:
     """Overall class to manage game assets and behavior."""
 
-    def __init__(self):
-        """Initialize the game, and create game resources."""
-        pygame.init()
+    def __init__(self, headless=False, settings=None):
+        """Initialize the game, and create game resources.
+
+        In headless mode the game uses SDL's dummy video driver and a window
+        of the configured size, so it can be simulated without a display.
+        settings replaces the default Settings when given.
+        """
+        self.headless = headless
+        if headless:
+            os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+        # Only the subsystems the game uses (pygame.init() would also start
+        # joysticks and so on; the mixer is started below unless it's muted)
+        self.startup = StartupTimer()
+        pygame.display.init()
+        pygame.font.init()
         self.clock = pygame.time.Clock()
-        self.settings = Settings()
+        self.settings = settings if settings is not None else Settings()
+        self.startup.mark('pygame')
 
-        self.screen = pygame.display.set_mode((0,0), pygame.FULLSCREEN)
+        if headless:
+            self.screen = pygame.display.set_mode(
+                (self.settings.screen_width, self.settings.screen_height))
+        else:
+            self.screen = pygame.display.set_mode((0,0), pygame.FULLSCREEN)
         self.settings.screen_width = self.screen.get_rect().width
         self.settings.screen_height = self.screen.get_rect().height
         pygame.display.set_caption("Asteroids")
+        self.startup.mark('display')
 
-        # Create an instance to store game statistics and create a scoreboard.
-        self.stats = GameStats(self.settings)
-        self.sb = Scoreboard(self)
+        # Images are loaded once, converted to the display format and shared.
+        # They are decoded in the background while the rest starts up.
+        self.assets = AssetManager()
+        self.assets.preload([Ship.image_path] + Rock.image_paths)
+
+        # Every game draws from its own seeded generator so it can be replayed
+        self._seed_source = random.Random(self.settings.random_seed)
+        self.rng = random.Random()
+        self.spawn_rng = random.Random()  # Rock layouts, drawn ahead of time by the spawner
+        self.game_seed = None
         
-        # Create start and game over screens
+        # Input recording of the current game (None when not recording)
+        self.recorder = None
+        self._fires_this_tick = 0
+
+        # Per-phase frame timing (near zero cost while disabled)
+        self.profiler = FrameProfiler(self.settings.profiler_enabled,
+                                      self.settings.profiler_window)
+
+        # Game events are buffered and written to disk by a background thread
+        # (simulated games keep no log, so parallel runs don't share a file)
+        self.events = EventLog(
+            None if headless else self.settings.event_log_path,
+            level=self.settings.event_log_level,
+            capacity=self.settings.event_log_capacity,
+            max_bytes=self.settings.event_log_max_bytes,
+            backups=self.settings.event_log_backups,
+            echo=self.settings.event_log_echo
+        )
+        self.events.start()
+        self.startup.mark('event_log')
+
+        # Create an instance to store game statistics
+        self.stats = GameStats(self.settings, self.events)
+        
+        # Show the start screen right away; it needs no images
         self.start_screen = StartScreen(self)
+        if not headless:
+            self.start_screen.show_start_screen()
+            pygame.display.flip()
+        self.startup.mark('start_screen')
+        
+        # Finished games are kept in a local database for the leaderboard
+        if self.settings.score_db_path and not headless:
+            self.scores = ScoreStore(self.settings.score_db_path)
+        else:
+            self.scores = None
+        self.leaderboard = []  # Best games, refreshed at every game over
+        self.last_game = None  # Stored row of the game that just ended
+        self.startup.mark('score_store')
+        
+        # Sound effects, decoded once and played through a fixed channel pool
+        # (silent in simulated games or without an audio device)
+        if self.settings.sound_enabled and not headless:
+            if not init_mixer(buffer=self.settings.sound_buffer):
+                self.events.log('sound_unavailable', WARNING)
+        self.sounds = SoundBank(self.settings.sound_channels, self.settings.sound_volume,
+                                self.settings.sound_dir, self.events)
+        self.startup.mark('sound')
+        
+        # Create the scoreboard and the game over screen
+        self.sb = Scoreboard(self)
         self.game_over_screen = GameOverScreen(self)
 
         # Initialize font for UI text (kept for backwards compatibility)
-        self.font = pygame.font.Font(None, 36)
+        self.font = self.assets.get_font(36)
+        self.startup.mark('hud')
         
         # Preload rock images for better performance
-        Rock.load_images()
+        Rock.load_images(self.assets, self.events)
 
         self.ship = Ship(self)
-        self.bullets = pygame.sprite.Group()
-        self.rocks = pygame.sprite.Group()
+        self.startup.mark('images')
+        self.bullets = EntityGroup()
+        self.rocks = EntityGroup()
+        
+        # Pre-allocated bullets and rocks, recycled instead of rebuilt on every spawn
+        self.bullet_pool = EntityPool(lambda: Bullet(self), self.settings.bullets_allowed)
+        self.rock_pool = EntityPool(lambda: Rock(self), self.settings.max_rocks)
+        
+        # Optional renderer that only updates the changed parts of the screen
+        if self.settings.dirty_rect_rendering:
+            self.renderer = DirtyRectRenderer(self.screen, self.settings.bg_color,
+                                              self.settings.dirty_rect_full_flip_ratio)
+        else:
+            self.renderer = None
+        
+        # Optional vectorized physics backend (None means per-sprite updates)
+        self.physics = create_physics(self.settings, self.events)
+        
+        # Uniform grid of rock collision rects, rebuilt once per frame
+        self.rock_grid = SpatialHash(self.settings.collision_cell_size)
+        
+        # Rock spawn timing, with rocks prepared ahead of time in idle frame time
+        self.spawner = SpawnScheduler(self)
+        
+        # Watches the settings profile for changes (None = no hot reload)
+        self.profile_watcher = None
+        self.startup.mark('world')
+        
+        self.events.log('startup', INFO, total_ms=round(self.startup.get_total() * 1000, 1),
+                        phases_ms=self.startup.get_phases_ms(),
+                        image_wait_ms=round(self.assets.wait_time * 1000, 1))
+        if self.settings.print_startup_report and not headless:
+            self.print_startup_report()
+
+    def print_startup_report(self):
+        """Print how long each startup phase took."""
+        print(f"Arranque en {self.startup.get_total() * 1000:.1f} ms:")
+        for name, ms in self.startup.get_phases_ms().items():
+            print(f"  {name:<14}{ms:8.1f} ms")
+        report = self.assets.get_report()
+        print(f"  ({report['images']} imágenes cargadas en "
+              f"{report['total_load_ms']:.1f} ms, {report['wait_ms']:.1f} ms esperando al hilo de carga; "
+              f"{report['fonts']} fuentes)")
+
+    def watch_profile(self, path, interval=1.0):
+        """Apply changes to the profile at path while the game runs."""
+        self.profile_watcher = ProfileWatcher(path, interval)
+
+    def apply_settings(self, values):
+        """Apply validated settings values to the running game.
+
+        Settings in RESTART_ONLY are left alone. Returns the names that
+        changed.
+        """
+        settings = self.settings
+        changed = [key for key, value in values.items()
+                   if key not in RESTART_ONLY and getattr(settings, key) != value]
+        ignored = [key for key in values if key in RESTART_ONLY]
+        if ignored:
+            self.events.log('settings_need_restart', WARNING, settings=sorted(ignored))
+        if not changed:
+            return changed
+        for key in changed:
+            setattr(settings, key, values[key])
+
+        # Rebuild whatever was created from the old values
+        if 'profiler_enabled' in changed:
+            self.profiler.enabled = settings.profiler_enabled
+        if 'sound_volume' in changed:
+            self.sounds.set_volume(settings.sound_volume)
+        if 'event_log_level' in changed:
+            self.events.level = LEVELS[settings.event_log_level]
+        if 'collision_cell_size' in changed:
+            self.rock_grid = SpatialHash(settings.collision_cell_size)
+        if {'rock_rotation_step', 'rock_scale_step', 'rock_atlas_budget_mb'} & set(changed):
+            # Rocks already in flight keep their scale and pick up frames of the new atlas
+            Rock.atlas = None
+            Rock.get_atlas(settings)
+        if {'dirty_rect_rendering', 'dirty_rect_full_flip_ratio', 'bg_color'} & set(changed):
+            if settings.dirty_rect_rendering:
+                self.renderer = DirtyRectRenderer(self.screen, settings.bg_color,
+                                                  settings.dirty_rect_full_flip_ratio)
+            else:
+                self.renderer = None
+            self.start_screen._cache_size = None
+            self.game_over_screen._cache_key = None
+        
+        # The recording can't reproduce a game whose settings changed halfway
+        if self.recorder is not None:
+            self.recorder = None
+            self.events.log('replay_discarded', WARNING, reason='settings_reloaded')
         
-        # Rock spawning timer
-        self.rock_spawn_timer = 0
+        self.events.log('settings_reloaded', INFO, settings=changed)
+        return changed
+
+    def _reload_profile(self):
+        """Apply the watched profile if it changed, keeping the old values if it's invalid."""
+        try:
+            values = self.profile_watcher.poll()
+        except (SettingsError, OSError, ValueError) as e:
+            self.events.log('settings_reload_failed', ERROR, path=self.profile_watcher.path,
+                            error=str(e))
+            return
+        if values is not None:
+            self.apply_settings(values)
 
     def run_game(self):
-        """Start the main loop for the game."""
+        """Start the main loop for the game.
+
+        The simulation advances in fixed steps of 1 / physics_tick_rate
+        seconds, while frames are drawn as often as max_render_fps allows,
+        with sprites interpolated between the last two steps. A watched
+        profile is checked for changes before each frame.
+        """
+        tick_seconds = 1.0 / self.settings.physics_tick_rate
+        accumulator = 0.0
+        previous_time = time.perf_counter()
+        
         while True:
-            self._check_events()
+            # Settings changed on disk are applied between frames
+            if self.profile_watcher is not None:
+                self._reload_profile()
+            
+            current_time = time.perf_counter()
+            frame_time = current_time - previous_time
+            accumulator += frame_time
+            previous_time = current_time
+            if self.profiler.enabled:
+                self.profiler.record('frame', frame_time)
+            
+            self.profiler.measure('_check_events', self._check_events)
             
             if self.stats.game_active:
-                self.ship.update()
-                self._update_bullets()
-                self._update_rocks()
-                self._check_bullet_rock_collisions()
-                self._check_ship_rock_collisions()
-                self._update_game_time()
+                # Run as many fixed steps as the elapsed time calls for
+                steps = 0
+                while (accumulator >= tick_seconds and self.stats.game_active and
+                       steps < self.settings.max_catchup_steps):
+                    self._update_world()
+                    accumulator -= tick_seconds
+                    steps += 1
+                
+                # Drop any backlog we couldn't catch up on instead of spiralling
+                if steps == self.settings.max_catchup_steps:
+                    accumulator = min(accumulator, tick_seconds)
+            else:
+                accumulator = 0.0
+            
+            alpha = accumulator / tick_seconds if self.settings.interpolate_rendering else 1.0
+            self._update_screen(min(alpha, 1.0))
             
-            self._update_screen()
-            self.clock.tick(60)
+            # Use the rest of the frame to build the next rocks to spawn
+            if self.stats.game_active:
+                self.profiler.measure('spawner.prepare', self.spawner.prepare,
+                                      self.settings.rock_spawn_budget_ms / 1000)
+            self.clock.tick(self.settings.max_render_fps)
+
+    def run_headless(self, games=1, max_frames=None, pilot=None):
+        """Simulate games without rendering, as fast as the CPU allows.
+
+        Each game runs until the ship runs out of lives or max_frames frames
+        have been simulated. The optional pilot is called with the game before
+        every frame so it can steer the ship and fire. Returns a report with
+        the frames simulated, the simulated frames per second and the final
+        statistics of every game.
+        """
+        total_frames = 0
+        summaries = []
+        start_time = time.perf_counter()
+
+        for _ in range(games):
+            self._start_game()
+            frames = 0
+            while self.stats.game_active and (max_frames is None or frames < max_frames):
+                if pilot is not None:
+                    pilot(self)
+                self._update_world()
+                frames += 1
+            total_frames += frames
+            summaries.append(self.stats.get_stats_summary())
+
+        elapsed = time.perf_counter() - start_time
+        return {
+            'games': games,
+            'frames': total_frames,
+            'elapsed_seconds': elapsed,
+            'fps': total_frames / elapsed if elapsed > 0 else 0.0,
+            'summaries': summaries,
+            'bullet_pool': self.bullet_pool.get_metrics(),
+            'rock_pool': self.rock_pool.get_metrics(),
+            'spawner': self.spawner.get_metrics()
+        }
+
+    def _update_world(self):
+        """Advance the game simulation by one frame."""
+        if self.recorder is not None:
+            self.recorder.record_tick(self.ship, self._fires_this_tick)
+        self._fires_this_tick = 0
+        
+        if self.ship.respawn_ticks:
+            # Hold the world while the respawn countdown runs
+            self.ship.respawn_ticks -= 1
+            return
+        
+        measure = self.profiler.measure
+        measure('ship.update', self.ship.update)
+        measure('_update_bullets', self._update_bullets)
+        measure('_update_rocks', self._update_rocks)
+        measure('_build_rock_grid', self._build_rock_grid)
+        measure('_check_bullet_rock_collisions', self._check_bullet_rock_collisions)
+        measure('_check_ship_rock_collisions', self._check_ship_rock_collisions)
+        self._update_game_time()
 
     def _check_events(self):
         """Respond to keypresses and mouse events."""
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
-                sys.exit()
+                self._quit()
             elif event.type == pygame.KEYDOWN:
                 self._check_keydown_events(event)
             elif event.type == pygame.KEYUP:
@@ -84,7 +367,11 @@ class Asteroids:
         elif event.key == pygame.K_DOWN:
             self.ship.moving_backward = True
         elif event.key == pygame.K_q:
-            sys.exit()
+            self._quit()
+        elif event.key == pygame.K_F3:
+            # Toggle the frame-time overlay
+            if self.profiler.enabled:
+                self.profiler.toggle_overlay()
         elif event.key == pygame.K_SPACE:
             if self.stats.game_active:
                 self._fire_bullet()
@@ -93,6 +380,23 @@ class Asteroids:
             if not self.stats.game_active:
                 self._start_game()
     
+    def _quit(self):
+        """Export the frame profile if profiling was on, close the game, then exit."""
+        if self.profiler.enabled and self.settings.profiler_export_path:
+            self.profiler.export(self.settings.profiler_export_path)
+            print(f"Perfil de frames guardado en {self.settings.profiler_export_path}")
+        self.close()
+        sys.exit()
+
+    def close(self):
+        """Finish the background work, save what's pending and release the display."""
+        self.assets.close()
+        self.sounds.stop()
+        if self.scores is not None:
+            self.scores.close()
+        self.events.close()
+        pygame.display.quit()
+
     def _check_keyup_events(self, event):
         """Respond to key releases."""
         if event.key == pygame.K_RIGHT:
@@ -116,8 +420,14 @@ class Asteroids:
             if button_clicked:
                 self._start_game()
     
-    def _start_game(self):
-        """Start a new game."""
+    def _start_game(self, seed=None):
+        """Start a new game, seeded with seed or a fresh seed from the game's source."""
+        if seed is None:
+            seed = self._seed_source.randrange(2 ** 63)
+        self.game_seed = seed
+        self.rng.seed(seed)
+        self.spawn_rng.seed(f'{seed}:spawn')
+        
         # Reset the game statistics and start the game
         self.stats.start_game()
         
@@ -127,36 +437,42 @@ class Asteroids:
         self.sb.prep_ships()
         
         # Empty the list of aliens and bullets
-        self.rocks.empty()
-        self.bullets.empty()
+        self._clear_entities()
         
-        # Create a new fleet and center the ship
-        self.ship.rect.center = self.ship.screen_rect.center
-        self.ship.x = float(self.ship.rect.centerx)
-        self.ship.y = float(self.ship.rect.centery)
+        # Center and stop the ship
+        self.ship.respawn()
         
-        # Reset ship movement flags
-        self.ship.moving_forward = False
-        self.ship.moving_backward = False
-        self.ship.rotating_left = False
-        self.ship.rotating_right = False
+        # Drop the rocks prepared for the last game and reset the spawn timers
+        self.spawner.reset()
         
-        # Reset rock spawning timer
-        self.rock_spawn_timer = 0
+        # Record the input of the new game
+        self._fires_this_tick = 0
+        if self.settings.replay_dir and not self.headless:
+            self.recorder = InputRecorder(seed, self.settings, self.ship.angle)
         
         # Hide the mouse cursor
         pygame.mouse.set_visible(False)
 
     def _fire_bullet(self):
         """Create a new bullet and add it to the bullets group."""
+        self._fires_this_tick += 1  # Replays fire as often, whether or not it succeeds
+        if self.ship.respawn_ticks:
+            return  # The ship isn't back yet
         if len(self.bullets) < self.settings.bullets_allowed:
-            new_bullet = Bullet(self)
-            self.bullets.add(new_bullet)
+            new_bullet = self.bullet_pool.acquire()
+            self._add_bullet(new_bullet)
             # Track bullet fired for statistics
             self.stats.add_bullet_fired()
+            self.sounds.play('fire')
 
     def _update_bullets(self):
         """Update position of bullets and get rid of old bullets."""
+        if self.physics is not None:
+            # Move all bullets at once and drop the ones that left the screen.
+            for bullet in self.physics.step_bullets():
+                self._remove_bullet(bullet)
+            return
+
         # Update bullet positions.
         self.bullets.update()
 
@@ -164,7 +480,7 @@ class Asteroids:
         for bullet in self.bullets.copy():
             if (bullet.rect.bottom <= 0 or bullet.rect.top >= self.settings.screen_height or 
                 bullet.rect.right <= 0 or bullet.rect.left >= self.settings.screen_width):
-                self.bullets.remove(bullet)
+                self._remove_bullet(bullet)
 
     def _update_rocks(self):
         """Update rocks and spawn new ones."""
@@ -172,82 +488,186 @@ class Asteroids:
         if not self.stats.game_active:
             return
             
-        # Update rock positions
-        self.rocks.update()
-        
-        # Remove rocks that have moved off screen and apply penalty only if they truly escaped
-        for rock in self.rocks.copy():
-            if rock.is_off_screen():
-                # Only apply penalty if the rock was actually visible on screen before escaping
-                if rock.has_been_visible:
+        if self.physics is not None:
+            # Move all rocks at once and drop the ones that left the screen
+            for rock, has_been_visible in self.physics.step_rocks():
+                if has_been_visible:
                     self.stats.add_rock_escaped()
-                self.rocks.remove(rock)
+                    self.sounds.play('rock_escaped')
+                self._remove_rock(rock)
+        else:
+            # Update rock positions
+            self.rocks.update()
+            
+            # Remove rocks that have moved off screen and apply penalty only if they truly escaped
+            for rock in self.rocks.copy():
+                if rock.is_off_screen():
+                    # Only apply penalty if the rock was actually visible on screen before escaping
+                    if rock.has_been_visible:
+                        self.stats.add_rock_escaped()
+                        self.sounds.play('rock_escaped')
+                    self._remove_rock(rock)
         
-        # Spawn new rocks periodically
-        self.rock_spawn_timer += 1
-        if (self.rock_spawn_timer >= self.settings.rock_spawn_rate and 
-            len(self.rocks) < self.settings.max_rocks):
-            new_rock = Rock(self)
-            self.rocks.add(new_rock)
-            self.rock_spawn_timer = 0
+        # Launch the rocks the spawner releases this tick
+        for rock in self.spawner.update():
+            self._add_rock(rock)
+
+    def _add_bullet(self, bullet):
+        """Add a bullet to the game."""
+        self.bullets.add(bullet)
+        if self.physics is not None:
+            self.physics.bullets.add(bullet)
+
+    def _remove_bullet(self, bullet):
+        """Remove a bullet from the game."""
+        self.bullets.remove(bullet)
+        if self.physics is not None:
+            self.physics.bullets.remove(bullet)
+        self.bullet_pool.release(bullet)
+
+    def _add_rock(self, rock):
+        """Launch a rock at the current difficulty's speed and add it to the game."""
+        rock.launch()
+        self.rocks.add(rock)
+        if self.physics is not None:
+            self.physics.rocks.add(rock)
+
+    def _remove_rock(self, rock):
+        """Remove a rock from the game."""
+        self.rocks.remove(rock)
+        if self.physics is not None:
+            self.physics.rocks.remove(rock)
+        self.rock_pool.release(rock)
+
+    def _clear_entities(self):
+        """Remove every rock and bullet from the game."""
+        self.rock_pool.release_all(self.rocks)
+        self.bullet_pool.release_all(self.bullets)
+        self.rocks.empty()
+        self.bullets.empty()
+        if self.physics is not None:
+            self.physics.clear()
+
+    def _build_rock_grid(self):
+        """Index every rock's collision rect in the spatial hash for this frame."""
+        if self.physics is not None:
+            return  # The physics backend tests collisions on its own arrays
+        self.rock_grid.clear()
+        if self.settings.precise_collisions:
+            # Whole frame rects are the broad phase; masks decide the actual hits
+            for rock in self.rocks:
+                self.rock_grid.insert(rock, rock.rect)
+        else:
+            for rock in self.rocks:
+                self.rock_grid.insert(rock, rock.collision_rect)
 
     def _check_bullet_rock_collisions(self):
         """Check for collisions between bullets and rocks using precise collision detection."""
-        for bullet in self.bullets.copy():
-            for rock in self.rocks.copy():
-                # Use the rock's collision_rect for more precise collision detection
-                if bullet.rect.colliderect(rock.collision_rect):
-                    # Remove both bullet and rock
-                    self.bullets.remove(bullet)
-                    self.rocks.remove(rock)
-                    
-                    # Update score and statistics
-                    points = self.stats.add_rock_destroyed()
-                    break  # Exit inner loop since bullet is gone
+        # Each bullet destroys the first rock it overlaps; removals are applied afterwards
+        if self.physics is not None:
+            hits = self.physics.collide_bullets_rocks()
+        else:
+            precise = self.settings.precise_collisions
+            hits = []
+            for bullet in self.bullets:
+                for rock in self.rock_grid.query(bullet.rect):
+                    if precise:
+                        hit = (bullet.rect.colliderect(rock.rect) and
+                               self._masks_overlap(rock.get_mask(), rock.rect,
+                                                   bullet.get_mask(), bullet.rect))
+                    else:
+                        # Use the rock's collision_rect for more precise collision detection
+                        hit = bullet.rect.colliderect(rock.collision_rect)
+                    if hit:
+                        hits.append((bullet, rock))
+                        self.rock_grid.discard(rock)
+                        break  # Exit inner loop since bullet is gone
+        
+        for bullet, rock in hits:
+            # Remove both bullet and rock
+            self._remove_bullet(bullet)
+            self._remove_rock(rock)
+            
+            # Update score and statistics
+            points = self.stats.add_rock_destroyed()
+            self.sounds.play('rock_destroyed')
 
     def _check_ship_rock_collisions(self):
         """Check for collisions between ship and rocks using precise collision detection."""
-        for rock in self.rocks:
-            if self.ship.collision_rect.colliderect(rock.collision_rect):
+        ship = self.ship
+        if ship.is_invulnerable():
+            return
+        precise = self.settings.precise_collisions
+        if self.physics is not None:
+            if precise:
+                rock = self.physics.first_rock_hitting(ship.rect, ship.get_mask)
+            else:
+                rock = self.physics.first_rock_hitting(ship.collision_rect)
+            if rock is not None:
+                self._ship_hit()
+            return
+        
+        broad_rect = ship.rect if precise else ship.collision_rect
+        for rock in self.rock_grid.query(broad_rect):
+            if precise:
+                hit = (ship.rect.colliderect(rock.rect) and
+                       self._masks_overlap(ship.get_mask(), ship.rect,
+                                           rock.get_mask(), rock.rect))
+            else:
+                hit = ship.collision_rect.colliderect(rock.collision_rect)
+            if hit:
                 self._ship_hit()
                 break  # Exit after first collision
     
+    def _masks_overlap(self, mask, rect, other_mask, other_rect):
+        """Check if two masks drawn at the top left corners of their rects share a pixel."""
+        offset = (other_rect.x - rect.x, other_rect.y - rect.y)
+        return mask.overlap(other_mask, offset) is not None
+    
     def _ship_hit(self):
         """Respond to the ship being hit by a rock."""
-        print("¡La nave fue golpeada!")
-        
         # Use the lives system from stats
         can_continue = self.stats.ship_hit()
+        self.sounds.play('ship_hit')
         
         if can_continue:
             # Remove all rocks and bullets to give player a fresh start
-            self.rocks.empty()
-            self.bullets.empty()
+            self._clear_entities()
             
-            # Reset ship position
-            self.ship.rect.center = self.ship.screen_rect.center
-            self.ship.x = float(self.ship.rect.centerx)
-            self.ship.y = float(self.ship.rect.centery)
-            
-            # Reset ship movement flags
-            self.ship.moving_forward = False
-            self.ship.moving_backward = False
-            self.ship.rotating_left = False
-            self.ship.rotating_right = False
-            
-            # Pause briefly to give player time to react
-            pygame.time.wait(1000)  # 1 second pause
+            # Bring the ship back after a countdown; the loop keeps running meanwhile
+            self.ship.respawn(self.settings.respawn_countdown_ticks,
+                              self.settings.respawn_invulnerable_ticks)
         else:
             # Game over - show the mouse cursor
             pygame.mouse.set_visible(True)
+            self._save_recording()
+            self._store_score()
+
+    def _store_score(self):
+        """Queue the finished game for the score database and refresh the leaderboard."""
+        if self.scores is None:
+            return
+        self.last_game = self.scores.submit(self.stats.get_stats_summary())
+        self.leaderboard = self.scores.top_scores(self.settings.leaderboard_size)
+
+    def _save_recording(self):
+        """Write the finished game's input recording to the replay directory."""
+        if self.recorder is None:
+            return
+        name = time.strftime('%Y%m%d-%H%M%S') + f'-{self.game_seed:x}.replay'
+        path = os.path.join(self.settings.replay_dir, name)
+        try:
+            self.recorder.save(path, self.stats.get_stats_summary())
+            self.events.log('replay_saved', level=INFO, path=path)
+        except OSError as e:
+            self.events.log('replay_save_failed', level=ERROR, path=path, error=str(e))
+        self.recorder = None
 
     def _update_game_time(self):
         """Update game time and difficulty level."""
         level_increased = self.stats.update_game_time()
-        # You can add special effects here when level increases
         if level_increased:
-            # Could add visual/audio feedback for level up
-            pass
+            self.sounds.play('level_up')
     
     def get_current_rock_speed_range(self):
         """Calculate current rock speed range based on difficulty level."""
@@ -257,32 +677,93 @@ class Asteroids:
         """Get current game time in seconds."""
         return self.stats.get_game_time_seconds()
 
-    def _update_screen(self):
-        """Update images on the screen, and flip to the new screen."""
-        self.screen.fill(self.settings.bg_color)
+    def _update_screen(self, alpha=1.0):
+        """Update images on the screen, and flip to the new screen.
+
+        alpha is how far the frame lies between the previous simulation step
+        (0.0) and the latest one (1.0).
+        """
+        if self.stats.game_active:
+            if self.physics is not None:
+                # Bring the rock and bullet sprites up to date before drawing them;
+                # menus don't draw them, so their frames skip the copy
+                self.physics.sync_views(alpha)
+            self._interpolate_sprites(alpha)
+        
+        if self.renderer is not None:
+            if self.stats.game_active:
+                self._update_screen_dirty()
+                return
+            # Menus draw the whole screen, so the next game frame starts from scratch
+            self.renderer.invalidate()
         
         if self.stats.game_active:
+            self.screen.fill(self.settings.bg_color)
+            
             # Draw game elements
             for bullet in self.bullets.sprites():
                 bullet.draw_bullet()
             self.rocks.draw(self.screen)
-            self.ship.blitme()
+            if self.ship.is_shown():
+                self.ship.blitme()
+            if self.ship.respawn_ticks:
+                self.sb.show_respawn_countdown(self.ship.respawn_ticks)
             
             # Optional: Draw collision rectangles for debugging (comment out for normal play)
             # self._draw_collision_rects()
             
             # Draw the score information.
-            self.sb.show_score()
+            self.profiler.measure('show_score', self.sb.show_score)
+            
+            if self.profiler.show_overlay:
+                self.profiler.draw_overlay(self.screen)
         
         elif not self.stats.game_active and not self.stats.game_over:
-            # Show start screen
+            # Show start screen (a single blit of the cached screen)
             self.start_screen.show_start_screen()
         
         elif self.stats.game_over:
-            # Show game over screen
+            # Show game over screen (a single blit of the cached screen)
             self.game_over_screen.show_game_over()
 
-        pygame.display.flip()
+        self.profiler.measure('display.flip', pygame.display.flip)
+    
+    def _interpolate_sprites(self, alpha):
+        """Move sprite rects alpha of the way from their previous to their current position.
+
+        Only the drawn rects change; every simulation step recomputes them
+        from the exact positions before they are used again.
+        """
+        ship = self.ship
+        ship.rect.center = (ship.prev_x + (ship.x - ship.prev_x) * alpha,
+                            ship.prev_y + (ship.y - ship.prev_y) * alpha)
+        
+        if self.physics is not None:
+            return  # Rocks and bullets were interpolated by sync_views
+        for sprite in self.rocks:
+            sprite.rect.center = (sprite.prev_x + (sprite.x - sprite.prev_x) * alpha,
+                                  sprite.prev_y + (sprite.y - sprite.prev_y) * alpha)
+        for sprite in self.bullets:
+            sprite.rect.center = (sprite.prev_x + (sprite.x - sprite.prev_x) * alpha,
+                                  sprite.prev_y + (sprite.y - sprite.prev_y) * alpha)
+    
+    def _update_screen_dirty(self):
+        """Redraw only the areas covered by game elements in this frame or the last one."""
+        renderer = self.renderer
+        renderer.begin_frame()
+        
+        for bullet in self.bullets.sprites():
+            renderer.add(bullet.draw_bullet())
+        renderer.add_all(self.screen.blits([(rock.image, rock.rect) for rock in self.rocks]))
+        if self.ship.is_shown():
+            renderer.add(self.ship.blitme())
+        if self.ship.respawn_ticks:
+            renderer.add(self.sb.show_respawn_countdown(self.ship.respawn_ticks))
+        renderer.add_all(self.profiler.measure('show_score', self.sb.show_score))
+        if self.profiler.show_overlay:
+            renderer.add(self.profiler.draw_overlay(self.screen))
+        
+        self.profiler.measure('display.flip', renderer.present)
     
     def _draw_collision_rects(self):
         """Draw collision rectangles for debugging purposes."""
@@ -293,7 +774,57 @@ class Asteroids:
         for rock in self.rocks:
             pygame.draw.rect(self.screen, (255, 0, 0), rock.collision_rect, 2)
 
+def _parse_args():
+    """Parse the command line options."""
+    parser = argparse.ArgumentParser(description="Asteroids")
+    parser.add_argument('--headless', action='store_true',
+                        help="simulate games without a display and report the simulation speed")
+    parser.add_argument('--games', type=int, default=1,
+                        help="number of games to simulate in headless mode")
+    parser.add_argument('--max-frames', type=int, default=None,
+                        help="maximum number of frames per simulated game")
+    parser.add_argument('--profiler', action='store_true',
+                        help="time each phase of the game loop (F3 toggles the overlay)")
+    parser.add_argument('--replay', metavar='FILE', default=None,
+                        help="re-run a recorded game headless and check its final statistics")
+    parser.add_argument('--profile', metavar='NAME', default=None,
+                        help="settings profile: a name in profiles/ (default, kiosk, stress) "
+                             "or a .toml/.json file, reloaded while the game runs")
+    return parser.parse_args()
+
 if __name__ == '__main__':
-    # Make a game instance, and run the game.
-    ai = Asteroids()
-    ai.run_game()
\ No newline at end of file
+    args = _parse_args()
+    settings = None
+    if args.profile:
+        try:
+            profile_path = resolve_profile(args.profile)
+            settings = load_settings(profile_path)
+        except (FileNotFoundError, SettingsError, ValueError) as e:
+            sys.exit(f"Perfil no válido: {e}")
+    if args.replay:
+        # Reproduce a recorded game as fast as possible.
+        report = run_replay(args.replay)
+        print(f"Reproducidos {report['ticks']} ticks en {report['elapsed_seconds']:.2f}s "
+              f"({report['speedup']:.0f}x tiempo real)")
+        print(f"Puntuación: {report['summary']['score']} "
+              f"(grabada: {report['recorded_summary']['score']})")
+        if report['matches']:
+            print("La partida se reprodujo exactamente")
+        else:
+            print("¡La partida reproducida no coincide con la grabación!")
+        sys.exit(0 if report['matches'] else 1)
+    elif args.headless:
+        # Simulate games as fast as possible and report the results.
+        ai = Asteroids(headless=True, settings=settings)
+        ai.profiler.enabled = ai.profiler.enabled or args.profiler
+        report = ai.run_headless(games=args.games, max_frames=args.max_frames)
+        print(f"Simulados {report['frames']} frames en {report['elapsed_seconds']:.2f}s "
+              f"({report['fps']:.0f} FPS)")
+        ai._quit()
+    else:
+        # Make a game instance, and run the game.
+        ai = Asteroids(settings=settings)
+        ai.profiler.enabled = ai.profiler.enabled or args.profiler
+        if args.profile:
+            ai.watch_profile(profile_path)
+        ai.run_game()
\ No newline at end of file
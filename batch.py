@@ -0,0 +1,211 @@
+"""
+Parallel batch simulator for tuning the game's difficulty.
+This module runs headless games for every combination of a grid of Settings
+values, driven by a scripted or AI pilot, across all CPU cores, and writes
+one row of final statistics per game to a columnar results file.
+
+Usage:
+    python batch.py --param rock_spawn_rate=60,120 --param max_rocks=10,20 --pilot aiming
+    python batch.py --grid grid.json --games 8 --output results.parquet
+"""
+
+import argparse
+import contextlib
+import itertools
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+try:
+    import pyarrow
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow is optional; results fall back to columnar JSON
+    pyarrow = None
+
+from asteroids import Asteroids
+from pilots import PILOTS, create_pilot
+from settings import Settings
+
+# Values tried when no grid is given
+DEFAULT_GRID = {
+    'base_rock_speed_min': [0.5, 1.0],
+    'base_rock_speed_max': [2.0, 3.0],
+    'speed_multiplier_per_level': [0.2, 0.4],
+    'rock_spawn_rate': [60, 120],
+    'max_rocks': [10, 20],
+    'difficulty_increase_time': [1200, 2400]
+}
+
+
+def expand_grid(grid):
+    """Return a dict of Settings overrides for every combination in grid."""
+    defaults = Settings()
+    for name in grid:
+        if not hasattr(defaults, name):
+            raise ValueError(f"Unknown setting '{name}'")
+    names = list(grid)
+    return [dict(zip(names, values)) for values in itertools.product(*grid.values())]
+
+
+def make_jobs(grid, pilot, games, seed, max_ticks):
+    """Build one job per game for every combination in grid."""
+    jobs = []
+    for overrides in expand_grid(grid):
+        for game_number in range(games):
+            jobs.append({
+                'index': len(jobs),
+                'overrides': overrides,
+                'pilot': pilot,
+                'seed': seed + game_number,
+                'max_ticks': max_ticks
+            })
+    return jobs
+
+
+def run_job(job):
+    """Simulate one game in this process and return its row of results."""
+    settings = Settings()
+    for name, value in job['overrides'].items():
+        setattr(settings, name, value)
+    settings.random_seed = job['seed']
+
+    # Keep the game's console messages out of the batch output
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        game = Asteroids(headless=True, settings=settings)
+        pilot = create_pilot(job['pilot'], job['seed'])
+        report = game.run_headless(games=1, max_frames=job['max_ticks'], pilot=pilot)
+
+    summary = report['summaries'][0]
+    speed_min, speed_max = summary['rock_speed_range']
+    row = dict(job['overrides'])
+    row.update({
+        'pilot': job['pilot'],
+        'seed': job['seed'],
+        'ticks': game.stats.game_time,
+        'survival_seconds': game.stats.game_time / settings.physics_tick_rate,
+        'game_over': game.stats.game_over,
+        'score': summary['score'],
+        'rocks_destroyed': summary['rocks_destroyed'],
+        'rocks_escaped': summary['rocks_escaped'],
+        'bullets_fired': summary['total_bullets_fired'],
+        'accuracy': summary['accuracy'],
+        'difficulty_level': summary['difficulty_level'],
+        'final_rock_speed_min': speed_min,
+        'final_rock_speed_max': speed_max,
+        'ships_left': summary['ships_left'],
+        'sim_seconds': report['elapsed_seconds']
+    })
+    return job['index'], row
+
+
+def run_batch(jobs, workers=None, progress=None):
+    """Run jobs across worker processes and return their rows in job order.
+
+    progress, when given, is called with (finished, total) after every job.
+    """
+    rows = [None] * len(jobs)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(run_job, job) for job in jobs]
+        for finished, future in enumerate(as_completed(futures), 1):
+            index, row = future.result()
+            rows[index] = row
+            if progress is not None:
+                progress(finished, len(jobs))
+    return rows
+
+
+def to_columns(rows):
+    """Turn a list of row dicts into a dict of equally long columns."""
+    columns = {}
+    for row in rows:
+        for name in row:
+            columns.setdefault(name, [])
+    for row in rows:
+        for name, values in columns.items():
+            values.append(row.get(name))
+    return columns
+
+
+def write_results(rows, path):
+    """Write rows to path as Parquet (if pyarrow is installed) or columnar JSON.
+
+    Returns the path actually written, which ends in .json when Parquet was
+    asked for but pyarrow is missing.
+    """
+    columns = to_columns(rows)
+    if path.endswith('.parquet'):
+        if pyarrow is not None:
+            pq.write_table(pyarrow.table(columns), path)
+            return path
+        print("¡Advertencia! pyarrow no está instalado, guardando en JSON columnar")
+        path = os.path.splitext(path)[0] + '.json'
+
+    with open(path, 'w') as file:
+        json.dump(columns, file)
+    return path
+
+
+def _parse_param(text):
+    """Parse NAME=V1,V2,... into (name, [values])."""
+    name, _, values = text.partition('=')
+    if not values:
+        raise argparse.ArgumentTypeError(f"Expected NAME=V1,V2,... but got '{text}'")
+    return name.strip(), [json.loads(value) for value in values.split(',')]
+
+
+def _parse_args():
+    """Parse the command line options."""
+    parser = argparse.ArgumentParser(description="Asteroids batch simulator")
+    parser.add_argument('--grid', default=None,
+                        help="JSON file mapping setting names to lists of values")
+    parser.add_argument('--param', type=_parse_param, action='append', default=[],
+                        help="a setting and its values, e.g. rock_spawn_rate=60,120 (may be repeated)")
+    parser.add_argument('--pilot', default='aiming', choices=sorted(PILOTS),
+                        help="who flies the ship")
+    parser.add_argument('--games', type=int, default=4,
+                        help="games per combination of settings")
+    parser.add_argument('--seed', type=int, default=1, help="seed of the first game of each combination")
+    parser.add_argument('--max-ticks', type=int, default=60 * 60 * 10,
+                        help="longest a game may run, in simulation ticks")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="worker processes (default: one per CPU core)")
+    parser.add_argument('--output', default='batch_results.parquet',
+                        help="results file (.parquet, or .json for columnar JSON)")
+    return parser.parse_args()
+
+
+def main():
+    """Run the batch described on the command line and write its results."""
+    args = _parse_args()
+    if args.grid:
+        with open(args.grid) as file:
+            grid = json.load(file)
+    elif args.param:
+        grid = {}
+    else:
+        grid = DEFAULT_GRID
+    grid.update(dict(args.param))
+
+    jobs = make_jobs(grid, args.pilot, args.games, args.seed, args.max_ticks)
+    print(f"Simulando {len(jobs)} partidas con el piloto '{args.pilot}' "
+          f"en {args.workers or os.cpu_count()} procesos")
+
+    def progress(finished, total):
+        print(f"\r{finished}/{total}", end='', flush=True)
+
+    start_time = time.perf_counter()
+    rows = run_batch(jobs, args.workers, progress)
+    elapsed = time.perf_counter() - start_time
+    print()
+
+    path = write_results(rows, args.output)
+    print(f"{len(rows)} partidas en {elapsed:.1f}s, resultados guardados en {path}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
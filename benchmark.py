@@ -0,0 +1,264 @@
+"""
+Reproducible benchmarks for the game's hot paths.
+This module runs standardized scenarios against the real Asteroids methods
+with a seeded game and SDL's dummy video driver, records per-frame
+timings and allocations, and compares the results with a stored baseline.
+
+Usage:
+    python benchmark.py                  # run and compare with the baseline
+    python benchmark.py --save-baseline  # run and store the results as the baseline
+"""
+
+import argparse
+import contextlib
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+from asteroids import Asteroids
+from rock import Rock
+from settings import Settings
+
+
+class Scenario:
+    """A named benchmark scenario built on a fresh headless game."""
+
+    def __init__(self, name, setup, frame, frames=600):
+        """Store the scenario's setup and per-frame callables."""
+        self.name = name
+        self.setup = setup  # Called once with the game before measuring
+        self.frame = frame  # Called with the game and the frame number
+        self.frames = frames
+
+
+def _disarm_ship(game):
+    """Ignore ship hits so rocks never end the run (collisions are still tested)."""
+    game._ship_hit = lambda: None
+
+
+def _fill_rocks(game, count):
+    """Top the rocks group up to count rocks."""
+    while len(game.rocks) < count:
+        game._add_rock(game.rock_pool.acquire())
+
+
+def _rocks_scenario(count, frames=600):
+    """Build a scenario that simulates and draws a steady field of rocks."""
+    def setup(game):
+        game.settings.max_rocks = count
+        game.settings.rock_spawn_rate = 10 ** 9  # The scenario does its own spawning
+        _disarm_ship(game)
+        _fill_rocks(game, count)
+
+    def frame(game, number):
+        game._update_world()
+        _fill_rocks(game, count)
+        game._update_screen()
+
+    return Scenario(f'rocks_{count}', setup, frame, frames)
+
+
+def _max_bullets_setup(game):
+    """Allow many bullets on screen at once."""
+    game.settings.bullets_allowed = 200
+    game.settings.max_rocks = 50
+    game.settings.rock_spawn_rate = 2
+    game.ship.rotating_right = True
+    _disarm_ship(game)
+
+
+def _max_bullets_frame(game, number):
+    """Fire every frame while the ship spins."""
+    game._fire_bullet()
+    game._update_world()
+    game._update_screen()
+
+
+def _hud_only_frame(game, number):
+    """Change the HUD values every frame and draw only the scoreboard."""
+    game.stats.game_time += 1
+    if number % 10 == 0:
+        game.stats.score += 10
+        game.stats.total_bullets_fired += 1
+    game.sb.show_score()
+
+
+def _game_over_setup(game):
+    """Finish the game so the game over screen is shown."""
+    game.stats.end_game()
+
+
+def _game_over_frame(game, number):
+    """Draw the game over screen."""
+    game._update_screen()
+
+
+def _spawn_storm_setup(game):
+    """Spawn a rock every tick."""
+    game.settings.rock_spawn_rate = 1
+    game.settings.max_rocks = 500
+    _disarm_ship(game)
+
+
+def _spawn_storm_frame(game, number):
+    """Simulate, clearing the field every two seconds to keep the spawns coming."""
+    if number % 120 == 0:
+        game._clear_entities()
+    game._update_world()
+
+
+SCENARIOS = [
+    _rocks_scenario(10),
+    _rocks_scenario(100),
+    _rocks_scenario(1000, frames=120),
+    Scenario('max_bullets', _max_bullets_setup, _max_bullets_frame),
+    Scenario('hud_only', lambda game: None, _hud_only_frame),
+    Scenario('game_over_screen', _game_over_setup, _game_over_frame),
+    Scenario('spawn_storm', _spawn_storm_setup, _spawn_storm_frame)
+]
+
+
+def _new_game(scenario, seed):
+    """Create a fresh, seeded headless game prepared for a scenario."""
+    Rock.atlas = None  # Start every scenario with a cold rotation atlas
+    settings = Settings()
+    settings.random_seed = seed
+    game = Asteroids(headless=True, settings=settings)
+    game._start_game()
+    scenario.setup(game)
+    return game
+
+
+def run_scenario(scenario, seed=1234):
+    """Run a scenario twice: once for timings and once under tracemalloc."""
+    # Timing pass
+    game = _new_game(scenario, seed)
+    timings = []
+    gc_before = sum(stat['collections'] for stat in gc.get_stats())
+    for number in range(scenario.frames):
+        start = time.perf_counter()
+        scenario.frame(game, number)
+        timings.append(time.perf_counter() - start)
+    gc_collections = sum(stat['collections'] for stat in gc.get_stats()) - gc_before
+    game.close()
+
+    # Allocation pass (tracemalloc slows everything down, so it runs separately).
+    # A frame's allocation is how far its traced memory peaked above where the
+    # frame started, which counts temporaries freed before the frame ends.
+    game = _new_game(scenario, seed)
+    allocations = []
+    tracemalloc.start()
+    start_size, _ = tracemalloc.get_traced_memory()
+    for number in range(scenario.frames):
+        tracemalloc.reset_peak()
+        frame_start, _ = tracemalloc.get_traced_memory()
+        scenario.frame(game, number)
+        allocations.append(tracemalloc.get_traced_memory()[1] - frame_start)
+    end_size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    game.close()
+
+    timings.sort()
+    allocations.sort()
+    count = len(timings)
+    return {
+        'frames': count,
+        'mean_ms': sum(timings) / count * 1000,
+        'p50_ms': _percentile(timings, 0.50) * 1000,
+        'p95_ms': _percentile(timings, 0.95) * 1000,
+        'p99_ms': _percentile(timings, 0.99) * 1000,
+        'max_ms': timings[-1] * 1000,
+        'gc_collections': gc_collections,
+        'alloc_mean_kb': sum(allocations) / count / 1024,
+        'alloc_p95_kb': _percentile(allocations, 0.95) / 1024,
+        'net_alloc_kb': (end_size - start_size) / 1024
+    }
+
+
+def _percentile(values, fraction):
+    """Return the value at fraction of the way through sorted values."""
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+def compare(results, baseline, tolerance):
+    """Return a list of (scenario, metric, baseline, current) regressions."""
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+        for metric in ('mean_ms', 'p95_ms', 'alloc_mean_kb'):
+            if metric in previous and current[metric] > previous[metric] * (1 + tolerance):
+                regressions.append((name, metric, previous[metric], current[metric]))
+    return regressions
+
+
+def _parse_args():
+    """Parse the command line options."""
+    parser = argparse.ArgumentParser(description="Asteroids benchmarks")
+    parser.add_argument('--scenario', action='append',
+                        help="run only this scenario (may be repeated)")
+    parser.add_argument('--frames', type=int, default=None,
+                        help="override the number of frames per scenario")
+    parser.add_argument('--seed', type=int, default=1234, help="random seed")
+    parser.add_argument('--baseline', default='benchmark_baseline.json',
+                        help="baseline file to compare against or save to")
+    parser.add_argument('--save-baseline', action='store_true',
+                        help="store these results as the new baseline")
+    parser.add_argument('--tolerance', type=float, default=0.10,
+                        help="allowed slowdown before a regression is flagged (0.10 = 10%%)")
+    parser.add_argument('--output', default=None, help="also write the results to this file")
+    return parser.parse_args()
+
+
+def main():
+    """Run the selected scenarios and report regressions against the baseline."""
+    args = _parse_args()
+    scenarios = [scenario for scenario in SCENARIOS
+                 if not args.scenario or scenario.name in args.scenario]
+
+    results = {}
+    for scenario in scenarios:
+        if args.frames:
+            scenario.frames = args.frames
+        # Keep the game's console messages out of the report
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            result = run_scenario(scenario, args.seed)
+        results[scenario.name] = result
+        print(f"{scenario.name:<18} mean {result['mean_ms']:7.3f} ms  "
+              f"p95 {result['p95_ms']:7.3f} ms  p99 {result['p99_ms']:7.3f} ms  "
+              f"gc {result['gc_collections']:4d}  alloc/frame {result['alloc_mean_kb']:7.1f} KB "
+              f"(p95 {result['alloc_p95_kb']:7.1f} KB)")
+
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(results, file, indent=2)
+
+    if args.save_baseline:
+        with open(args.baseline, 'w') as file:
+            json.dump(results, file, indent=2)
+        print(f"Línea base guardada en {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"No hay línea base en {args.baseline}; usa --save-baseline para crearla")
+        return 0
+
+    with open(args.baseline) as file:
+        baseline = json.load(file)
+    regressions = compare(results, baseline, args.tolerance)
+    for name, metric, previous, current in regressions:
+        unit = 'KB' if metric.endswith('_kb') else 'ms'
+        print(f"¡Regresión! {name} {metric}: {previous:.3f} {unit} -> {current:.3f} {unit}")
+    if not regressions:
+        print("Sin regresiones respecto a la línea base")
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,35 +1,54 @@
 import pygame
 import math
-from pygame.sprite import Sprite
+from entity import Entity
 
-class Bullet(Sprite):
+class Bullet(Entity):
     """A class to manage bullets fired from the ship."""
 
+    # Bullets keep only their own state; the screen, settings and ship are
+    # reached through the game
+    __slots__ = ('game', 'rect', 'x', 'y', 'prev_x', 'prev_y', 'angle',
+                 'velocity_x', 'velocity_y')
+
+    # Solid collision masks shared by every bullet, keyed by size
+    _masks = {}
+
     def __init__(self, ai_game):
         """Create a bullet object at the ship's current position."""
-        super().__init__()
-        self.screen = ai_game.screen
-        self.settings = ai_game.settings
-        self.color = self.settings.bullet_color
+        self.game = ai_game
+
+        # Create a bullet rect once; it is reused whenever the bullet is recycled.
+        settings = ai_game.settings
+        self.rect = pygame.Rect(0, 0, settings.bullet_width, settings.bullet_height)
+        self.reset()
 
-        # Create a bullet rect at (0, 0) and then set correct position.
-        self.rect = pygame.Rect(0, 0, self.settings.bullet_width, self.settings.bullet_height)
-        self.rect.center = ai_game.ship.rect.center
+    def reset(self):
+        """Place the bullet at the ship and aim it where the ship points."""
+        # Use the ship's simulated position, not its (possibly interpolated) rect.
+        ship = self.game.ship
+        self.rect.center = (ship.x, ship.y)
 
         # Store the bullet's position as floats.
         self.x = float(self.rect.centerx)
         self.y = float(self.rect.centery)
+        self.prev_x = self.x
+        self.prev_y = self.y
         
         # Store the ship's angle to calculate bullet direction
-        self.angle = ai_game.ship.angle
+        self.angle = ship.angle
         
         # Calculate velocity components based on ship's direction
         radians = math.radians(self.angle - 90)
-        self.velocity_x = self.settings.bullet_speed * math.cos(radians)
-        self.velocity_y = self.settings.bullet_speed * math.sin(radians)
+        speed = self.game.settings.bullet_speed
+        self.velocity_x = speed * math.cos(radians)
+        self.velocity_y = speed * math.sin(radians)
 
     def update(self):
         """Move the bullet in the direction it was fired."""
+        # Remember where the bullet was for interpolated drawing.
+        self.prev_x = self.x
+        self.prev_y = self.y
+
         # Update the float position of the bullet using velocity components.
         self.x += self.velocity_x
         self.y += self.velocity_y
@@ -38,6 +57,14 @@ class Bullet(Sprite):
         self.rect.centerx = self.x
         self.rect.centery = self.y
 
+    def get_mask(self):
+        """Return the bullet's collision mask (the bullet fills its whole rect)."""
+        size = self.rect.size
+        mask = Bullet._masks.get(size)
+        if mask is None:
+            mask = Bullet._masks[size] = pygame.Mask(size, fill=True)
+        return mask
+
     def draw_bullet(self):
-        """Draw the bullet to the screen."""
-        pygame.draw.rect(self.screen, self.color, self.rect)
\ No newline at end of file
+        """Draw the bullet to the screen and return the area drawn."""
+        return pygame.draw.rect(self.game.screen, self.game.settings.bullet_color, self.rect)
\ No newline at end of file
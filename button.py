@@ -17,7 +17,7 @@ class Button:
         self.width, self.height = 200, 50
         self.button_color = (0, 135, 0)  # Dark green
         self.text_color = (255, 255, 255)  # White
-        self.font = pygame.font.Font(None, 48)
+        self.font = ai_game.assets.get_font(48)
         
         # Build the button's rect object and center it.
         self.rect = pygame.Rect(0, 0, self.width, self.height)
@@ -33,16 +33,19 @@ class Button:
         self.msg_image_rect = self.msg_image.get_rect()
         self.msg_image_rect.center = self.rect.center
     
-    def draw_button(self):
-        """Draw blank button and then draw message."""
+    def draw_button(self, surface=None):
+        """Draw blank button and then draw message (on the screen unless surface is given)."""
+        if surface is None:
+            surface = self.screen
+        
         # Draw button background
-        self.screen.fill(self.button_color, self.rect)
+        surface.fill(self.button_color, self.rect)
         
         # Draw button border for better visibility
-        pygame.draw.rect(self.screen, (255, 255, 255), self.rect, 2)
+        pygame.draw.rect(surface, (255, 255, 255), self.rect, 2)
         
         # Draw button text
-        self.screen.blit(self.msg_image, self.msg_image_rect)
+        surface.blit(self.msg_image, self.msg_image_rect)
     
     def update_msg(self, msg):
         """Update the button message."""
@@ -79,30 +82,55 @@ class GameOverScreen:
         self.stats = ai_game.stats
         
         # Font settings
-        self.title_font = pygame.font.Font(None, 72)
-        self.text_font = pygame.font.Font(None, 36)
+        self.title_font = ai_game.assets.get_font(72)
+        self.text_font = ai_game.assets.get_font(36)
+        self.leaderboard_font = ai_game.assets.get_font(30)
         self.text_color = (255, 255, 255)
+        self.highlight_color = (255, 255, 0)  # The game that just ended
         
         # Create play button (position will be set dynamically)
         self.play_button = PlayButton(ai_game)
+        
+        # Composed screen and the state it was composed for
+        self._image = None
+        self._cache_key = None
     
     def show_game_over(self):
-        """Display the game over screen with statistics."""
+        """Display the game over screen with statistics.
+
+        The screen is composed once into a cached surface and rebuilt only
+        when the statistics, the leaderboard or the resolution change.
+        """
+        stats_summary = self.stats.get_stats_summary()
+        last_game = self.ai_game.last_game
+        key = (self.screen.get_size(), tuple(stats_summary.values()),
+               tuple(game['played_at'] for game in self.ai_game.leaderboard),
+               last_game['played_at'] if last_game is not None else None)
+        if key != self._cache_key:
+            self._cache_key = key
+            self._image = self._compose(stats_summary)
+        self.screen.blit(self._image, (0, 0))
+    
+    def _compose(self, stats_summary):
+        """Draw the whole game over screen onto a new surface."""
+        self.screen_rect = self.screen.get_rect()
+        image = pygame.Surface(self.screen_rect.size).convert()
+        image.fill(self.ai_game.settings.bg_color)
+        
         # Semi-transparent overlay
         overlay = pygame.Surface((self.screen_rect.width, self.screen_rect.height))
         overlay.set_alpha(128)
         overlay.fill((0, 0, 0))
-        self.screen.blit(overlay, (0, 0))
+        image.blit(overlay, (0, 0))
         
         # Game Over title
         title_image = self.title_font.render("GAME OVER", True, (255, 0, 0))
         title_rect = title_image.get_rect()
         title_rect.centerx = self.screen_rect.centerx
         title_rect.y = self.screen_rect.centery - 180
-        self.screen.blit(title_image, title_rect)
+        image.blit(title_image, title_rect)
         
         # Final statistics
-        stats_summary = self.stats.get_stats_summary()
         final_stats = [
             f"Final Score: {stats_summary['score']:,}",
             f"Rocks Destroyed: {stats_summary['rocks_destroyed']}",
@@ -118,7 +146,7 @@ class GameOverScreen:
             stat_rect = stat_image.get_rect()
             stat_rect.centerx = self.screen_rect.centerx
             stat_rect.y = y_offset
-            self.screen.blit(stat_image, stat_rect)
+            image.blit(stat_image, stat_rect)
             y_offset += 35
         
         # Position play again button below statistics
@@ -127,7 +155,33 @@ class GameOverScreen:
         self.play_button._prep_msg("PLAY AGAIN")
         
         # Draw play again button
-        self.play_button.draw_button()
+        self.play_button.draw_button(image)
+        
+        if self.ai_game.leaderboard:
+            self._draw_leaderboard(image, title_rect.bottom + 30)
+        return image
+    
+    def _draw_leaderboard(self, image, top):
+        """Draw the best games in a column to the right of the statistics."""
+        centerx = self.screen_rect.centerx + 350
+        header_image = self.text_font.render("TOP SCORES", True, (255, 0, 0))
+        header_rect = header_image.get_rect()
+        header_rect.centerx = centerx
+        header_rect.y = top
+        image.blit(header_image, header_rect)
+        
+        last_game = self.ai_game.last_game
+        y_offset = header_rect.bottom + 15
+        for rank, game in enumerate(self.ai_game.leaderboard, 1):
+            is_last = last_game is not None and game['played_at'] == last_game['played_at']
+            line = f"{rank}. {game['score']:,}  (Lv {game['difficulty_level']}, {game['time_seconds']}s)"
+            line_image = self.leaderboard_font.render(
+                line, True, self.highlight_color if is_last else self.text_color)
+            rect = line_image.get_rect()
+            rect.centerx = centerx
+            rect.y = y_offset
+            image.blit(line_image, rect)
+            y_offset += 30
 
 class StartScreen:
     """A class to display the start screen."""
@@ -139,25 +193,40 @@ class StartScreen:
         self.screen_rect = self.screen.get_rect()
         
         # Font settings
-        self.title_font = pygame.font.Font(None, 96)
-        self.subtitle_font = pygame.font.Font(None, 48)
-        self.text_font = pygame.font.Font(None, 32)
+        self.title_font = ai_game.assets.get_font(96)
+        self.subtitle_font = ai_game.assets.get_font(48)
+        self.text_font = ai_game.assets.get_font(32)
         self.text_color = (255, 255, 255)
         
         # Create play button (position will be set dynamically)
         self.play_button = PlayButton(ai_game)
+        
+        # Composed screen and the resolution it was composed for
+        self._image = None
+        self._cache_size = None
     
     def show_start_screen(self):
-        """Display the start screen."""
+        """Display the start screen, composing it again only if the resolution changed."""
+        size = self.screen.get_size()
+        if size != self._cache_size:
+            self._cache_size = size
+            self._image = self._compose()
+        self.screen.blit(self._image, (0, 0))
+    
+    def _compose(self):
+        """Draw the whole start screen onto a new surface."""
+        self.screen_rect = self.screen.get_rect()
+        image = pygame.Surface(self.screen_rect.size).convert()
+        
         # Fill background
-        self.screen.fill((0, 0, 20))  # Darker blue background
+        image.fill((0, 0, 20))  # Darker blue background
         
         # Game title
         title_image = self.title_font.render("ASTEROIDS", True, (255, 255, 255))
         title_rect = title_image.get_rect()
         title_rect.centerx = self.screen_rect.centerx
         title_rect.y = self.screen_rect.centery - 200
-        self.screen.blit(title_image, title_rect)
+        image.blit(title_image, title_rect)
         
         # Instructions
         instructions = [
@@ -176,7 +245,7 @@ class StartScreen:
                 inst_rect = inst_image.get_rect()
                 inst_rect.centerx = self.screen_rect.centerx
                 inst_rect.y = y_offset
-                self.screen.blit(inst_image, inst_rect)
+                image.blit(inst_image, inst_rect)
             y_offset += 30
         
         # Position play button below instructions
@@ -185,4 +254,5 @@ class StartScreen:
         self.play_button._prep_msg("PLAY")
         
         # Draw play button
-        self.play_button.draw_button()
+        self.play_button.draw_button(image)
+        return image
@@ -0,0 +1,70 @@
+"""
+Entity and EntityGroup classes for the game's many small sprites.
+This module gives rocks and bullets a base without an instance __dict__,
+which pygame's Sprite always has, and a group that keeps the membership
+itself instead of storing it on every entity.
+"""
+
+
+class Entity:
+    """Base of rocks and bullets: subclasses list all their state in __slots__."""
+
+    __slots__ = ()
+
+    def update(self):
+        """Advance the entity by one tick; subclasses override it."""
+
+
+class EntityGroup:
+    """An ordered set of entities with the parts of pygame's Group the game uses.
+
+    Entities keep no reference to their groups, so membership only changes
+    through add(), remove() and empty().
+    """
+
+    def __init__(self, *entities):
+        """Create the group, optionally holding entities."""
+        self._entities = dict.fromkeys(entities)  # Entity -> None, in insertion order
+
+    def add(self, *entities):
+        """Add entities that aren't in the group yet."""
+        for entity in entities:
+            self._entities[entity] = None
+
+    def remove(self, *entities):
+        """Remove entities, ignoring those not in the group."""
+        for entity in entities:
+            self._entities.pop(entity, None)
+
+    def empty(self):
+        """Remove every entity."""
+        self._entities.clear()
+
+    def sprites(self):
+        """Return a list of the entities, in the order they were added."""
+        return list(self._entities)
+
+    def copy(self):
+        """Return a new group holding the same entities."""
+        return EntityGroup(*self._entities)
+
+    def update(self):
+        """Update every entity; entities may leave the group meanwhile."""
+        for entity in self.sprites():
+            entity.update()
+
+    def draw(self, surface):
+        """Blit every entity's image at its rect and return the areas drawn."""
+        return surface.blits([(entity.image, entity.rect) for entity in self._entities])
+
+    def __contains__(self, entity):
+        """Return whether entity is in the group."""
+        return entity in self._entities
+
+    def __iter__(self):
+        """Iterate over a snapshot, so entities may leave the group meanwhile."""
+        return iter(self.sprites())
+
+    def __len__(self):
+        """Return the number of entities."""
+        return len(self._entities)
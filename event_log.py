@@ -0,0 +1,136 @@
+"""
+EventLog class for structured, buffered game-event logging.
+This module records typed game events in a ring buffer that a background
+thread drains to a rotating JSON Lines file, so the game loop never waits on
+the disk or the console.
+"""
+
+import json
+import os
+import threading
+import time
+from collections import deque
+
+# Event levels, lowest to highest
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+LEVELS = {'debug': DEBUG, 'info': INFO, 'warning': WARNING, 'error': ERROR}
+_LEVEL_NAMES = {value: name for name, value in LEVELS.items()}
+
+
+class EventLog:
+    """A ring buffer of game events written to disk by a background thread."""
+
+    def __init__(self, path=None, level=INFO, capacity=4096, max_bytes=1024 * 1024,
+                 backups=3, flush_interval=0.25, echo=False):
+        """Initialize the log.
+
+        Without a path every event is dropped. When the buffer is full the
+        oldest unwritten events are overwritten and counted in dropped. The
+        file is rotated to path.1 ... path.<backups> once it grows past
+        max_bytes. With echo the writer thread also prints every event.
+        """
+        self.path = path
+        self.level = LEVELS.get(level, level) if isinstance(level, str) else level
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.flush_interval = flush_interval
+        self.echo = echo
+
+        self._buffer = deque(maxlen=capacity)
+        self.dropped = 0
+        self.written = 0
+
+        self._file = None
+        self._file_bytes = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def enabled(self):
+        """Check if events are being recorded."""
+        return self.path is not None
+
+    def log(self, event_type, level=INFO, **fields):
+        """Record an event; never blocks on I/O."""
+        if self.path is None or level < self.level:
+            return
+        buffer = self._buffer
+        if len(buffer) == buffer.maxlen:
+            self.dropped += 1
+        buffer.append((time.time(), level, event_type, fields))
+
+    def start(self):
+        """Start the background writer thread."""
+        if self.path is None or self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name='event-log', daemon=True)
+        self._thread.start()
+
+    def close(self):
+        """Stop the writer thread and write whatever is still buffered."""
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+        self._drain()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _run(self):
+        """Write buffered events until the log is closed."""
+        while not self._stop.wait(self.flush_interval):
+            self._drain()
+
+    def _drain(self):
+        """Write every buffered event to the file."""
+        buffer = self._buffer
+        if not buffer:
+            return
+        lines = []
+        while buffer:
+            timestamp, level, event_type, fields = buffer.popleft()
+            record = {'time': round(timestamp, 3), 'level': _LEVEL_NAMES.get(level, level),
+                      'event': event_type}
+            record.update(fields)
+            lines.append(json.dumps(record, ensure_ascii=False))
+            if self.echo:
+                print(f"[{record['level']}] {event_type} {fields}")
+
+        data = '\n'.join(lines) + '\n'
+        try:
+            if self._file is None:
+                self._open()
+            self._file.write(data)
+            self._file.flush()
+        except OSError:
+            self.dropped += len(lines)
+            return
+        self.written += len(lines)
+        self._file_bytes += len(data.encode('utf-8'))
+        if self._file_bytes >= self.max_bytes:
+            self._rotate()
+
+    def _open(self):
+        """Open the log file for appending."""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(self.path, 'a', encoding='utf-8')
+        self._file_bytes = self._file.tell()
+
+    def _rotate(self):
+        """Shift path -> path.1 -> path.2 ... and start a new file."""
+        self._file.close()
+        self._file = None
+        for number in range(self.backups - 1, 0, -1):
+            source = f"{self.path}.{number}"
+            if os.path.exists(source):
+                os.replace(source, f"{self.path}.{number + 1}")
+        if self.backups > 0:
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
@@ -3,12 +3,15 @@ GameStats class to track and manage all game statistics.
 This module handles scoring, difficulty progression, game timing, and game states.
 """
 
+from event_log import EventLog, DEBUG, INFO
+
 class GameStats:
     """Track statistics for the Asteroids game."""
     
-    def __init__(self, settings):
-        """Initialize statistics."""
+    def __init__(self, settings, events=None):
+        """Initialize statistics, reporting changes to the events log if one is given."""
         self.settings = settings
+        self.events = events if events is not None else EventLog()
         
         # Game state
         self.game_active = False
@@ -27,7 +30,7 @@ class GameStats:
         self.ships_left = self.settings.ship_lives
         
         # Game time and difficulty tracking
-        self.game_time = 0  # Total game time in frames
+        self.game_time = 0  # Total game time in simulation ticks
         self.current_difficulty_level = 0
         
         # Performance tracking
@@ -50,7 +53,7 @@ class GameStats:
         # Check if difficulty level increased
         if new_difficulty_level > self.current_difficulty_level:
             self.current_difficulty_level = new_difficulty_level
-            print(f"Nivel de dificultad aumentado a: {self.current_difficulty_level + 1}")
+            self.events.log('level_up', level=INFO, difficulty_level=self.current_difficulty_level + 1)
             return True  # Return True if level increased
         return False
     
@@ -64,8 +67,8 @@ class GameStats:
         if self.total_bullets_fired > 0:
             self.accuracy = (self.rocks_destroyed / self.total_bullets_fired) * 100
         
-        print(f"¡Roca destruida! +{points} puntos. Score total: {self.score}")
-        print(f"Rocas destruidas: {self.rocks_destroyed} | Precisión: {self.accuracy:.1f}%")
+        self.events.log('rock_destroyed', level=DEBUG, points=points, score=self.score,
+                        rocks_destroyed=self.rocks_destroyed, accuracy=round(self.accuracy, 1))
         
         return points  # Return points earned
     
@@ -87,8 +90,8 @@ class GameStats:
         if self.score < 0:
             self.score = 0
         
-        print(f"¡Roca escapó! {penalty} puntos. Score total: {self.score}")
-        print(f"Rocas escapadas: {self.rocks_escaped}")
+        self.events.log('rock_escaped', level=DEBUG, points=penalty, score=self.score,
+                        rocks_escaped=self.rocks_escaped)
         
         return penalty  # Return penalty applied
     
@@ -97,12 +100,12 @@ class GameStats:
         if self.ships_left > 0:
             # Decrement ships_left
             self.ships_left -= 1
-            print(f"¡Nave golpeada! Vidas restantes: {self.ships_left}")
+            self.events.log('ship_hit', level=INFO, ships_left=self.ships_left)
             
             # Check if game should end
             if self.ships_left == 0:
                 self.end_game()
-                print("¡Sin más vidas! Fin del juego.")
+                self.events.log('game_over', level=INFO, **self.get_stats_summary())
                 return False  # Game over
             return True  # Continue playing
         else:
@@ -111,7 +114,7 @@ class GameStats:
     
     def get_game_time_seconds(self):
         """Get current game time in seconds."""
-        return self.game_time // 60
+        return self.game_time // self.settings.physics_tick_rate
     
     def get_current_rock_speed_range(self):
         """Calculate current rock speed range based on difficulty level."""
@@ -0,0 +1,170 @@
+"""
+Memory report of the game's entities.
+This module builds rocks and bullets on a headless game and reports how many
+bytes each one takes: traced allocations per entity, plus the size of the
+instance and its attribute dictionary. Each entity is measured next to an
+estimate of its layout before __slots__: a reconstruction, not the old
+classes themselves, so the "before" figures are approximate.
+
+Usage:
+    python memory_report.py               # 1000 rocks and 1000 bullets
+    python memory_report.py --count 5000
+"""
+
+import argparse
+import contextlib
+import gc
+import io
+import os
+import sys
+import tracemalloc
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+from pygame.sprite import Sprite
+
+from asteroids import Asteroids
+from bullet import Bullet
+from rock import Rock
+from settings import Settings
+
+
+class DictRock(Sprite):
+    """An estimate of a rock's layout before __slots__.
+
+    A pygame Sprite holding, in its instance __dict__, the attributes the
+    old Rock assigned, including the references to the game's objects and
+    images that Rock now reaches through the game. The old methods, and any
+    allocations they made, are not reproduced.
+    """
+
+    def __init__(self, ai_game):
+        """Copy the state of a new Rock into the old layout."""
+        super().__init__()
+        rock = Rock(ai_game)
+        self.screen = ai_game.screen
+        self.settings = ai_game.settings
+        self.ai_game = ai_game
+        self.events = ai_game.events
+        self.rng = ai_game.spawn_rng
+        self.speed_rng = ai_game.rng
+        self.rect = rock.rect
+        self.collision_padding = Rock.collision_padding
+        self.collision_rect = rock.collision_rect
+        self.source_image = rock._get_source_image()
+        self.image_index = rock.image_index
+        self.scale_factor = rock.scale_factor
+        self.image = rock.image
+        self.original_image = Rock.atlas.get_base_image(
+            self.source_image, rock.image_index, rock.scale_factor)
+        self.rotation_angle = rock.rotation_angle
+        self.rotation_speed = rock.rotation_speed
+        self.velocity_x = rock.velocity_x
+        self.velocity_y = rock.velocity_y
+        self.x = rock.x
+        self.y = rock.y
+        self.prev_x = rock.prev_x
+        self.prev_y = rock.prev_y
+        self.speed = rock.speed
+        self.has_been_visible = rock.has_been_visible
+
+
+class DictBullet(Sprite):
+    """An estimate of a bullet's layout before __slots__ (see DictRock)."""
+
+    def __init__(self, ai_game):
+        """Copy the state of a new Bullet into the old layout."""
+        super().__init__()
+        bullet = Bullet(ai_game)
+        self.screen = ai_game.screen
+        self.settings = ai_game.settings
+        self.color = ai_game.settings.bullet_color
+        self.ship = ai_game.ship
+        self.rect = bullet.rect
+        self.x = bullet.x
+        self.y = bullet.y
+        self.prev_x = bullet.prev_x
+        self.prev_y = bullet.prev_y
+        self.angle = bullet.angle
+        self.velocity_x = bullet.velocity_x
+        self.velocity_y = bullet.velocity_y
+
+
+def measure(factory, count):
+    """Build count entities with factory and return a report of their memory use."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    entities = [factory() for _ in range(count)]
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    sample = entities[0]
+    attributes = getattr(sample, '__dict__', {})
+    slots = [name for cls in type(sample).__mro__ for name in getattr(cls, '__slots__', ())]
+    return {
+        'bytes_per_entity': (after - before) / count,
+        'instance_bytes': sys.getsizeof(sample),
+        'dict_bytes': sys.getsizeof(attributes) if hasattr(sample, '__dict__') else 0,
+        'dict_attributes': len(attributes),
+        'slots': len(slots)
+    }
+
+
+def run_report(count=1000):
+    """Measure rocks and bullets of a seeded headless game.
+
+    Returns {entity: {'current': report, 'dict': report}}, where 'dict' is
+    the estimated layout from before __slots__.
+    """
+    settings = Settings()
+    settings.random_seed = 1
+    settings.rock_atlas_budget_mb = 1024  # Room for every frame, so nothing is evicted and redrawn
+    with contextlib.redirect_stdout(io.StringIO()):
+        game = Asteroids(headless=True, settings=settings)
+    game._start_game(seed=1)
+
+    # Fill the shared rotation atlas first, every angle of every scale bucket
+    # the rocks use, so only per-entity memory is counted
+    Rock.atlas = None
+    atlas = Rock.get_atlas(settings)
+    rocks = [Rock(game) for _ in range(count)]
+    buckets = {(rock.image_index, rock.scale_factor): rock._get_source_image() for rock in rocks}
+    for (image_index, scale), image in buckets.items():
+        for frame in range(atlas.frame_count):
+            atlas.get_frame(image, image_index, scale, frame * atlas.angle_step)
+    del rocks
+
+    return {
+        'rock': {
+            'current': measure(lambda: Rock(game), count),
+            'dict': measure(lambda: DictRock(game), count)
+        },
+        'bullet': {
+            'current': measure(lambda: Bullet(game), count),
+            'dict': measure(lambda: DictBullet(game), count)
+        }
+    }
+
+
+def _parse_args():
+    """Parse the command line options."""
+    parser = argparse.ArgumentParser(description="Asteroids entity memory report")
+    parser.add_argument('--count', type=int, default=1000,
+                        help="entities of each kind to build and measure")
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = _parse_args()
+    report = run_report(args.count)
+    for name, results in report.items():
+        for layout, label in (('dict', 'antes*'), ('current', 'actual')):
+            result = results[layout]
+            print(f"{name:<8}{label:<10}{result['bytes_per_entity']:8.0f} B/entidad  "
+                  f"(instancia {result['instance_bytes']} B, __dict__ {result['dict_bytes']} B "
+                  f"con {result['dict_attributes']} atributos, {result['slots']} slots)")
+        saved = results['dict']['bytes_per_entity'] - results['current']['bytes_per_entity']
+        print(f"{'':<18}{saved:8.0f} B/entidad ahorrados")
+    print("* Estimación: una reconstrucción de la disposición anterior, no las clases originales")
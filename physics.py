@@ -0,0 +1,370 @@
+"""
+Vectorized physics backend for rocks and bullets.
+This module keeps the state of every rock and bullet in NumPy arrays so that
+movement, screen-edge checks and collision tests run as batched array
+operations. Rock and Bullet objects stay in the sprite groups as thin views
+that are only brought up to date before drawing.
+"""
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the game falls back to per-sprite updates
+    np = None
+
+from event_log import WARNING
+from rock import Rock
+
+
+def create_physics(settings, events):
+    """Return the physics backend selected in settings, or None for per-sprite updates."""
+    if settings.physics_backend != 'numpy':
+        return None
+    if np is None:
+        events.log('numpy_unavailable', WARNING, fallback='python')
+        return None
+    return NumpyPhysics(settings)
+
+
+def _round_half_away(values):
+    """Round like pygame does when a float is assigned to a Rect attribute."""
+    return np.where(values >= 0, np.floor(values + 0.5), np.ceil(values - 0.5))
+
+
+class EntityArrays:
+    """Struct-of-arrays storage for one kind of entity."""
+
+    # Names and dtypes of the per-entity columns; filled in by subclasses.
+    fields = ()
+
+    def __init__(self, capacity=64):
+        """Allocate empty columns with room for capacity entities."""
+        self.count = 0
+        self.entities = []
+        self.slots = {}  # Entity -> index of its row in the columns
+        for name, dtype in self.fields:
+            setattr(self, name, np.zeros(capacity, dtype=dtype))
+        self.seq = np.zeros(capacity, dtype=np.int64)
+        self._next_seq = 0
+
+    def add(self, entity):
+        """Store an entity in the next free slot and return the slot."""
+        if self.count == len(self.seq):
+            self._grow()
+        slot = self.count
+        self.count += 1
+        self.entities.append(entity)
+        self.seq[slot] = self._next_seq
+        self._next_seq += 1
+        self.slots[entity] = slot
+        self.load(slot, entity)
+        return slot
+
+    def remove(self, entity):
+        """Remove an entity by moving the last entity into its slot."""
+        slot = self.slots.pop(entity)
+        last = self.count - 1
+        if slot != last:
+            moved = self.entities[last]
+            self.entities[slot] = moved
+            self.slots[moved] = slot
+            for name, _ in self.fields:
+                column = getattr(self, name)
+                column[slot] = column[last]
+            self.seq[slot] = self.seq[last]
+        self.entities.pop()
+        self.count = last
+
+    def clear(self):
+        """Remove every entity."""
+        self.entities = []
+        self.slots = {}
+        self.count = 0
+
+    def load(self, slot, entity):
+        """Copy an entity's scalar state into its slot."""
+        raise NotImplementedError
+
+    def _grow(self):
+        """Double the capacity of every column."""
+        capacity = len(self.seq) * 2
+        for name, _ in self.fields:
+            column = getattr(self, name)
+            grown = np.zeros(capacity, dtype=column.dtype)
+            grown[:self.count] = column[:self.count]
+            setattr(self, name, grown)
+        grown = np.zeros(capacity, dtype=np.int64)
+        grown[:self.count] = self.seq[:self.count]
+        self.seq = grown
+
+
+class RockArrays(EntityArrays):
+    """Array state of every live rock."""
+
+    fields = (
+        ('x', 'f8'),
+        ('y', 'f8'),
+        ('prev_x', 'f8'),
+        ('prev_y', 'f8'),
+        ('velocity_x', 'f8'),
+        ('velocity_y', 'f8'),
+        ('speed', 'f8'),
+        ('rotation_angle', 'f8'),
+        ('rotation_speed', 'f8'),
+        ('base_width', 'i8'),
+        ('base_height', 'i8'),
+        ('collision_width', 'i8'),
+        ('collision_height', 'i8'),
+        ('has_been_visible', '?')
+    )
+
+    def load(self, slot, rock):
+        """Copy a rock's state into its slot."""
+        self.x[slot] = rock.x
+        self.y[slot] = rock.y
+        self.prev_x[slot] = rock.prev_x
+        self.prev_y[slot] = rock.prev_y
+        self.velocity_x[slot] = rock.velocity_x
+        self.velocity_y[slot] = rock.velocity_y
+        self.speed[slot] = rock.speed
+        self.rotation_angle[slot] = rock.rotation_angle
+        self.rotation_speed[slot] = rock.rotation_speed
+        self.base_width[slot], self.base_height[slot] = rock.get_base_size()
+        self.collision_width[slot] = abs(rock.collision_rect.width)
+        self.collision_height[slot] = abs(rock.collision_rect.height)
+        self.has_been_visible[slot] = rock.has_been_visible
+
+
+class BulletArrays(EntityArrays):
+    """Array state of every live bullet."""
+
+    fields = (
+        ('x', 'f8'),
+        ('y', 'f8'),
+        ('prev_x', 'f8'),
+        ('prev_y', 'f8'),
+        ('velocity_x', 'f8'),
+        ('velocity_y', 'f8'),
+        ('width', 'i8'),
+        ('height', 'i8')
+    )
+
+    def load(self, slot, bullet):
+        """Copy a bullet's state into its slot."""
+        self.x[slot] = bullet.x
+        self.y[slot] = bullet.y
+        self.prev_x[slot] = bullet.prev_x
+        self.prev_y[slot] = bullet.prev_y
+        self.velocity_x[slot] = bullet.velocity_x
+        self.velocity_y[slot] = bullet.velocity_y
+        self.width[slot] = bullet.rect.width
+        self.height[slot] = bullet.rect.height
+
+
+class NumpyPhysics:
+    """Batched movement, screen-edge and collision tests for rocks and bullets."""
+
+    def __init__(self, settings):
+        """Initialize empty rock and bullet arrays."""
+        self.settings = settings
+        self.rocks = RockArrays()
+        self.bullets = BulletArrays()
+
+    def clear(self):
+        """Forget every rock and bullet."""
+        self.rocks.clear()
+        self.bullets.clear()
+
+    def step_bullets(self):
+        """Move every bullet and return the bullets that left the screen."""
+        b = self.bullets
+        n = b.count
+        if not n:
+            return []
+        b.prev_x[:n] = b.x[:n]
+        b.prev_y[:n] = b.y[:n]
+        b.x[:n] += b.velocity_x[:n]
+        b.y[:n] += b.velocity_y[:n]
+
+        left, top, right, bottom = self._bullet_rects()
+        gone = ((bottom <= 0) | (top >= self.settings.screen_height) |
+                (right <= 0) | (left >= self.settings.screen_width))
+        return [b.entities[i] for i in np.flatnonzero(gone)]
+
+    def step_rocks(self):
+        """Move and spin every rock and return (rock, has_been_visible) for those off screen."""
+        r = self.rocks
+        n = r.count
+        if not n:
+            return []
+        r.prev_x[:n] = r.x[:n]
+        r.prev_y[:n] = r.y[:n]
+        r.x[:n] += r.velocity_x[:n] * r.speed[:n]
+        r.y[:n] += r.velocity_y[:n] * r.speed[:n]
+        r.rotation_angle[:n] = (r.rotation_angle[:n] + r.rotation_speed[:n]) % 360
+
+        left, top, right, bottom = self._rock_rects()
+        width = self.settings.screen_width
+        height = self.settings.screen_height
+        visible = (right > 0) & (left < width) & (bottom > 0) & (top < height)
+        r.has_been_visible[:n] |= visible
+
+        off_screen = (right < 0) | (left > width) | (bottom < 0) | (top > height)
+        return [(r.entities[i], bool(r.has_been_visible[i]))
+                for i in np.flatnonzero(off_screen)]
+
+    def collide_bullets_rocks(self):
+        """Return (bullet, rock) hits in the order the sprite groups would find them.
+
+        Bullets are visited in the order they were fired and each one hits the
+        oldest rock it overlaps that no earlier bullet has already destroyed.
+        """
+        b = self.bullets
+        r = self.rocks
+        if not b.count or not r.count:
+            return []
+
+        # With precise collisions the rotated image rects are only the broad phase
+        precise = self.settings.precise_collisions
+        b_left, b_top, b_right, b_bottom = self._bullet_rects()
+        if precise:
+            r_left, r_top, r_right, r_bottom = self._rock_rects()
+        else:
+            r_left, r_top, r_right, r_bottom = self._rock_collision_rects()
+        overlap = ((b_left[:, None] < r_right[None, :]) &
+                   (b_right[:, None] > r_left[None, :]) &
+                   (b_top[:, None] < r_bottom[None, :]) &
+                   (b_bottom[:, None] > r_top[None, :]))
+        if not precise:
+            overlap &= self._nonempty_rock_collisions()[None, :]
+
+        hit_rows = np.flatnonzero(overlap.any(axis=1))
+        if not len(hit_rows):
+            return []
+
+        hits = []
+        destroyed = set()
+        rock_seq = r.seq[:r.count]
+        for row in hit_rows[np.argsort(b.seq[hit_rows])]:
+            columns = np.flatnonzero(overlap[row])
+            bullet = b.entities[row]
+            for column in columns[np.argsort(rock_seq[columns])]:
+                if column in destroyed:
+                    continue
+                if precise and not self._rock_mask_overlaps(
+                        column, r_left, r_top, bullet.get_mask(), b_left[row], b_top[row]):
+                    continue
+                destroyed.add(column)
+                hits.append((bullet, r.entities[column]))
+                break
+        return hits
+
+    def first_rock_hitting(self, rect, get_mask=None):
+        """Return the oldest rock that overlaps rect, or None.
+
+        Without get_mask rect is tested against the rocks' collision rects.
+        With it, rect is tested against the rotated image rects and the hit
+        is confirmed against get_mask(), the mask drawn at rect's top left.
+        """
+        r = self.rocks
+        if not r.count or not rect.width or not rect.height:
+            return None
+        if get_mask is not None:
+            left, top, right, bottom = self._rock_rects()
+            overlap = ((rect.left < right) & (rect.right > left) &
+                       (rect.top < bottom) & (rect.bottom > top))
+        else:
+            left, top, right, bottom = self._rock_collision_rects()
+            overlap = ((rect.left < right) & (rect.right > left) &
+                       (rect.top < bottom) & (rect.bottom > top) &
+                       self._nonempty_rock_collisions())
+        columns = np.flatnonzero(overlap)
+        if not len(columns):
+            return None
+        columns = columns[np.argsort(r.seq[columns])]
+        if get_mask is None:
+            return r.entities[columns[0]]
+        
+        mask = get_mask()
+        for column in columns:
+            if self._rock_mask_overlaps(column, left, top, mask, rect.left, rect.top):
+                return r.entities[column]
+        return None
+
+    def _rock_mask_overlaps(self, column, rock_left, rock_top, mask, left, top):
+        """Check if a mask drawn at (left, top) touches the mask of the rock in column."""
+        rock = self.rocks.entities[column]
+        rock_mask = rock.get_mask(float(self.rocks.rotation_angle[column]))
+        offset = (int(left - rock_left[column]), int(top - rock_top[column]))
+        return rock_mask.overlap(mask, offset) is not None
+
+    def sync_views(self, alpha=1.0):
+        """Copy the array state back into the Rock and Bullet objects for drawing.
+
+        Sprites are drawn alpha of the way from their previous position to
+        their current one.
+        """
+        r = self.rocks
+        n = r.count
+        draw_x = (r.prev_x[:n] + (r.x[:n] - r.prev_x[:n]) * alpha).tolist()
+        draw_y = (r.prev_y[:n] + (r.y[:n] - r.prev_y[:n]) * alpha).tolist()
+        state = zip(r.entities, r.x[:n].tolist(), r.y[:n].tolist(),
+                    r.rotation_angle[:n].tolist(), r.has_been_visible[:n].tolist(),
+                    draw_x, draw_y)
+        for rock, x, y, angle, has_been_visible, rock_draw_x, rock_draw_y in state:
+            rock.x = x
+            rock.y = y
+            rock.rotation_angle = angle
+            rock.has_been_visible = has_been_visible
+            rock.apply_pose()
+            rock.rect.center = (rock_draw_x, rock_draw_y)
+
+        b = self.bullets
+        n = b.count
+        draw_x = (b.prev_x[:n] + (b.x[:n] - b.prev_x[:n]) * alpha).tolist()
+        draw_y = (b.prev_y[:n] + (b.y[:n] - b.prev_y[:n]) * alpha).tolist()
+        state = zip(b.entities, b.x[:n].tolist(), b.y[:n].tolist(), draw_x, draw_y)
+        for bullet, x, y, bullet_draw_x, bullet_draw_y in state:
+            bullet.x = x
+            bullet.y = y
+            bullet.rect.center = (bullet_draw_x, bullet_draw_y)
+
+    def _bullet_rects(self):
+        """Return the left, top, right and bottom edges of every bullet rect."""
+        b = self.bullets
+        n = b.count
+        left = _round_half_away(b.x[:n]) - b.width[:n] // 2
+        top = _round_half_away(b.y[:n]) - b.height[:n] // 2
+        return left, top, left + b.width[:n], top + b.height[:n]
+
+    def _rock_rects(self):
+        """Return the edges of every rock's rotated image rect.
+
+        Each rect is sized like the atlas frame pygame.transform.rotate would
+        produce for the rock's angle, snapped to the rotation step and wrapped
+        to the atlas's frames like RotationAtlas.quantize_angle does.
+        """
+        r = self.rocks
+        n = r.count
+        atlas = Rock.get_atlas(self.settings)
+        frame_index = np.round(r.rotation_angle[:n] / atlas.angle_step) % atlas.frame_count
+        frame_angle = np.radians(frame_index * atlas.angle_step)
+        cos = np.abs(np.cos(frame_angle))
+        sin = np.abs(np.sin(frame_angle))
+        width = (r.base_width[:n] * cos + r.base_height[:n] * sin).astype(np.int64)
+        height = (r.base_width[:n] * sin + r.base_height[:n] * cos).astype(np.int64)
+        left = _round_half_away(r.x[:n]) - width // 2
+        top = _round_half_away(r.y[:n]) - height // 2
+        return left, top, left + width, top + height
+
+    def _rock_collision_rects(self):
+        """Return the edges of every rock's collision rect."""
+        r = self.rocks
+        n = r.count
+        left = _round_half_away(r.x[:n]) - r.collision_width[:n] // 2
+        top = _round_half_away(r.y[:n]) - r.collision_height[:n] // 2
+        return left, top, left + r.collision_width[:n], top + r.collision_height[:n]
+
+    def _nonempty_rock_collisions(self):
+        """Return a mask of rocks whose collision rect has an area (pygame never hits empty rects)."""
+        n = self.rocks.count
+        return (self.rocks.collision_width[:n] > 0) & (self.rocks.collision_height[:n] > 0)
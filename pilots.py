@@ -0,0 +1,132 @@
+"""
+Scripted and AI pilots for simulated games.
+A pilot is called with the game before every simulation tick, like a player
+at the keyboard: it sets the ship's movement flags and fires bullets. Pilots
+are looked up by name so batch jobs can name them across processes.
+"""
+
+import math
+import random
+
+
+class IdlePilot:
+    """Never touch the controls; a baseline for how long rocks alone take to win."""
+
+    def __init__(self, seed=None):
+        """Create the pilot (the seed is unused)."""
+
+    def __call__(self, game):
+        """Do nothing."""
+
+
+class SpinnerPilot:
+    """Spin in place and fire at a steady rate."""
+
+    def __init__(self, seed=None, fire_interval=15):
+        """Create the pilot, firing every fire_interval ticks."""
+        self.fire_interval = fire_interval
+        self.ticks = 0
+
+    def __call__(self, game):
+        """Keep rotating and fire on schedule."""
+        game.ship.rotating_right = True
+        self.ticks += 1
+        if self.ticks % self.fire_interval == 0:
+            game._fire_bullet()
+
+
+class RandomPilot:
+    """Mash the controls at random, like a player who isn't paying attention."""
+
+    def __init__(self, seed=None, change_chance=0.05, fire_chance=0.1):
+        """Create the pilot with its own random generator."""
+        self.rng = random.Random(seed)
+        self.change_chance = change_chance
+        self.fire_chance = fire_chance
+
+    def __call__(self, game):
+        """Sometimes change direction, sometimes fire."""
+        ship = game.ship
+        rng = self.rng
+        if rng.random() < self.change_chance:
+            ship.rotating_left = rng.random() < 0.4
+            ship.rotating_right = not ship.rotating_left and rng.random() < 0.6
+            ship.moving_forward = rng.random() < 0.3
+            ship.moving_backward = not ship.moving_forward and rng.random() < 0.1
+        if rng.random() < self.fire_chance:
+            game._fire_bullet()
+
+
+class AimingPilot:
+    """Turn towards the closest rock, leading its motion, and fire when lined up."""
+
+    def __init__(self, seed=None, fire_cooldown=10, aim_tolerance=4.0):
+        """Create the pilot.
+
+        fire_cooldown is the number of ticks between shots and aim_tolerance
+        how many degrees off target a shot may still be fired.
+        """
+        self.fire_cooldown = fire_cooldown
+        self.aim_tolerance = aim_tolerance
+        self.cooldown = 0
+
+    def __call__(self, game):
+        """Aim at the closest rock and fire when the ship points at it."""
+        ship = game.ship
+        ship.rotating_left = ship.rotating_right = False
+        self.cooldown = max(0, self.cooldown - 1)
+
+        if game.physics is not None:
+            game.physics.sync_views(1.0)  # Rock sprites are only updated for drawing
+        target = self._closest_rock(game)
+        if target is None:
+            return
+
+        # Lead the target by the time a bullet needs to reach it
+        bullet_speed = game.settings.bullet_speed
+        distance = math.hypot(target.x - ship.x, target.y - ship.y)
+        lead = distance / bullet_speed
+        aim_x = target.x + target.velocity_x * target.speed * lead
+        aim_y = target.y + target.velocity_y * target.speed * lead
+
+        # Ship angle 0 points up and grows clockwise
+        desired = math.degrees(math.atan2(aim_y - ship.y, aim_x - ship.x)) + 90
+        difference = (desired - ship.angle + 180) % 360 - 180
+        if difference > self.aim_tolerance:
+            ship.rotating_right = True
+        elif difference < -self.aim_tolerance:
+            ship.rotating_left = True
+        elif self.cooldown == 0:
+            game._fire_bullet()
+            self.cooldown = self.fire_cooldown
+
+    def _closest_rock(self, game):
+        """Return the rock closest to the ship that has entered the screen, or None."""
+        ship = game.ship
+        closest = None
+        closest_distance = None
+        for rock in game.rocks:
+            if not rock.has_been_visible:
+                continue
+            distance = (rock.x - ship.x) ** 2 + (rock.y - ship.y) ** 2
+            if closest is None or distance < closest_distance:
+                closest = rock
+                closest_distance = distance
+        return closest
+
+
+PILOTS = {
+    'idle': IdlePilot,
+    'spinner': SpinnerPilot,
+    'random': RandomPilot,
+    'aiming': AimingPilot
+}
+
+
+def create_pilot(name, seed=None):
+    """Build the pilot registered under name."""
+    try:
+        pilot_class = PILOTS[name]
+    except KeyError:
+        raise ValueError(f"Unknown pilot '{name}'; choose one of {', '.join(PILOTS)}")
+    return pilot_class(seed)
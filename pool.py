@@ -0,0 +1,59 @@
+"""
+EntityPool class to recycle game entities.
+This module keeps released bullets and rocks around so new spawns reuse them
+instead of allocating fresh objects for the garbage collector to clean up.
+"""
+
+
+class EntityPool:
+    """A pool of reusable entities with acquire/release semantics."""
+
+    def __init__(self, factory, size=0):
+        """Create the pool and pre-allocate size entities.
+
+        factory is called with no arguments to build a new entity; a recycled
+        entity is re-randomized with its reset() method instead.
+        """
+        self._factory = factory
+        self._free = [factory() for _ in range(size)]
+
+        # Occupancy metrics
+        self.allocated = size  # Entities ever built by the pool
+        self.in_use = 0
+        self.peak_in_use = 0
+        self.reused = 0  # Acquisitions served from the free list
+
+    def acquire(self):
+        """Return a ready-to-use entity, reusing a released one when possible."""
+        if self._free:
+            entity = self._free.pop()
+            entity.reset()
+            self.reused += 1
+        else:
+            entity = self._factory()
+            self.allocated += 1
+
+        self.in_use += 1
+        if self.in_use > self.peak_in_use:
+            self.peak_in_use = self.in_use
+        return entity
+
+    def release(self, entity):
+        """Return an entity to the pool once it has left the game."""
+        self._free.append(entity)
+        self.in_use -= 1
+
+    def release_all(self, entities):
+        """Return several entities to the pool."""
+        for entity in entities:
+            self.release(entity)
+
+    def get_metrics(self):
+        """Get a summary of the pool's occupancy."""
+        return {
+            'allocated': self.allocated,
+            'in_use': self.in_use,
+            'free': len(self._free),
+            'peak_in_use': self.peak_in_use,
+            'reused': self.reused
+        }
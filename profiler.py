@@ -0,0 +1,153 @@
+"""
+FrameProfiler class to measure where each frame's time goes.
+This module times the phases of the game loop, keeps a rolling window of
+samples per phase, draws a percentile overlay and exports the results. It
+also times the phases of the game's startup.
+"""
+
+import csv
+import json
+import math
+import time
+from collections import deque
+
+import pygame
+
+
+class FrameProfiler:
+    """Time named phases of the game loop and report their percentiles."""
+
+    def __init__(self, enabled=False, window=600):
+        """Initialize the profiler with a rolling window of samples per phase."""
+        self.enabled = enabled
+        self.window = window
+        self.samples = {}  # Phase name -> deque of durations in seconds
+        self.show_overlay = False
+
+        # The overlay is re-rendered only every few frames
+        self.overlay_refresh_frames = 30
+        self._overlay_image = None
+        self._overlay_age = 0
+        self._font = None
+
+    def measure(self, name, func, *args):
+        """Call func(*args) and, when enabled, record how long it took under name."""
+        if not self.enabled:
+            return func(*args)
+        start = time.perf_counter()
+        result = func(*args)
+        self.record(name, time.perf_counter() - start)
+        return result
+
+    def record(self, name, seconds):
+        """Record one duration in seconds for a phase."""
+        samples = self.samples.get(name)
+        if samples is None:
+            samples = self.samples[name] = deque(maxlen=self.window)
+        samples.append(seconds)
+
+    def toggle_overlay(self):
+        """Show or hide the on-screen overlay."""
+        self.show_overlay = not self.show_overlay
+        self._overlay_image = None
+
+    def get_summary(self):
+        """Get count, mean and p50/p95/p99/max in milliseconds for every phase."""
+        summary = {}
+        for name, samples in self.samples.items():
+            ordered = sorted(samples)
+            count = len(ordered)
+            if not count:
+                continue
+            summary[name] = {
+                'count': count,
+                'mean_ms': sum(ordered) / count * 1000,
+                'p50_ms': _percentile(ordered, 50) * 1000,
+                'p95_ms': _percentile(ordered, 95) * 1000,
+                'p99_ms': _percentile(ordered, 99) * 1000,
+                'max_ms': ordered[-1] * 1000
+            }
+        return summary
+
+    def draw_overlay(self, screen):
+        """Draw the percentile table in the bottom left corner and return its rect."""
+        self._overlay_age += 1
+        if self._overlay_image is None or self._overlay_age >= self.overlay_refresh_frames:
+            self._overlay_image = self._render_overlay()
+            self._overlay_age = 0
+
+        rect = self._overlay_image.get_rect()
+        rect.bottomleft = (10, screen.get_rect().bottom - 10)
+        return screen.blit(self._overlay_image, rect)
+
+    def export(self, path):
+        """Write the summary to path, as CSV if it ends in .csv and JSON otherwise."""
+        summary = self.get_summary()
+        if path.endswith('.csv'):
+            columns = ['count', 'mean_ms', 'p50_ms', 'p95_ms', 'p99_ms', 'max_ms']
+            with open(path, 'w', newline='') as file:
+                writer = csv.writer(file)
+                writer.writerow(['phase'] + columns)
+                for name, values in summary.items():
+                    writer.writerow([name] + [values[column] for column in columns])
+        else:
+            with open(path, 'w') as file:
+                json.dump(summary, file, indent=2)
+
+    def _render_overlay(self):
+        """Render the percentile table onto a translucent surface."""
+        if self._font is None:
+            self._font = pygame.font.Font(None, 20)
+
+        rows = [("fase", "p50 ms", "p95 ms", "p99 ms")]
+        for name, values in self.get_summary().items():
+            rows.append((name, f"{values['p50_ms']:.2f}",
+                         f"{values['p95_ms']:.2f}", f"{values['p99_ms']:.2f}"))
+
+        # The default font isn't monospaced, so each column gets a fixed x position
+        column_x = (5, 185, 245, 305)
+        column_width = 55
+        line_height = self._font.get_linesize()
+        overlay = pygame.Surface((column_x[-1] + column_width + 5,
+                                  line_height * len(rows) + 10), pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, 180))
+        for row_index, row in enumerate(rows):
+            y = 5 + row_index * line_height
+            for column, text in enumerate(row):
+                image = self._font.render(text, True, (0, 255, 0))
+                if column == 0:
+                    overlay.blit(image, (column_x[0], y))
+                else:
+                    # Right-align the numbers
+                    x = column_x[column] + column_width - image.get_width()
+                    overlay.blit(image, (x, y))
+        return overlay
+
+
+def _percentile(ordered, percent):
+    """Return the nearest-rank percentile of an already sorted list."""
+    rank = math.ceil(percent / 100 * len(ordered))
+    return ordered[max(0, min(len(ordered), rank) - 1)]
+
+
+class StartupTimer:
+    """Time the consecutive phases of the game's startup."""
+
+    def __init__(self):
+        """Start timing."""
+        self.phases = []  # (name, seconds) in the order they ran
+        self._start = self._last = time.perf_counter()
+
+    def mark(self, name):
+        """Record the time since the previous mark as phase name."""
+        now = time.perf_counter()
+        self.phases.append((name, now - self._last))
+        self._last = now
+
+    def get_total(self):
+        """Get the seconds from the start to the last mark."""
+        return self._last - self._start
+
+    def get_phases_ms(self):
+        """Get {phase: milliseconds}, rounded to 0.1 ms."""
+        return {name: round(seconds * 1000, 1) for name, seconds in self.phases}
@@ -0,0 +1,68 @@
+"""
+DirtyRectRenderer class for partial screen updates.
+This module erases and presents only the screen areas that changed between
+frames, falling back to a full flip when too much of the screen changed.
+"""
+
+import pygame
+
+
+class DirtyRectRenderer:
+    """Track the rects drawn each frame and update only those on the display."""
+
+    def __init__(self, screen, bg_color, full_flip_ratio=0.5):
+        """Initialize the renderer for a screen and its background color."""
+        self.screen = screen
+        self.screen_rect = screen.get_rect()
+        self.bg_color = bg_color
+
+        # Above this fraction of the screen area a full flip is cheaper
+        self.full_flip_area = self.screen_rect.width * self.screen_rect.height * full_flip_ratio
+
+        # Rects drawn in the previous frame (to erase) and in the current one
+        self._previous_rects = []
+        self._current_rects = []
+        self._full_redraw = True
+
+        # Statistics about how frames were presented
+        self.partial_updates = 0
+        self.full_flips = 0
+
+    def invalidate(self):
+        """Force the next frame to redraw and flip the whole screen."""
+        self._full_redraw = True
+
+    def begin_frame(self):
+        """Erase everything drawn in the previous frame."""
+        if self._full_redraw:
+            self.screen.fill(self.bg_color)
+        else:
+            for rect in self._previous_rects:
+                self.screen.fill(self.bg_color, rect)
+
+    def add(self, rect):
+        """Record a rect drawn during the current frame."""
+        rect = rect.clip(self.screen_rect)
+        if rect.width and rect.height:
+            self._current_rects.append(rect)
+
+    def add_all(self, rects):
+        """Record several rects drawn during the current frame."""
+        for rect in rects:
+            self.add(rect)
+
+    def present(self):
+        """Show the frame, updating only the dirty areas when that is cheaper."""
+        dirty_rects = self._previous_rects + self._current_rects
+        dirty_area = sum(rect.width * rect.height for rect in dirty_rects)
+
+        if self._full_redraw or dirty_area > self.full_flip_area:
+            pygame.display.flip()
+            self.full_flips += 1
+        else:
+            pygame.display.update(dirty_rects)
+            self.partial_updates += 1
+
+        self._previous_rects = self._current_rects
+        self._current_rects = []
+        self._full_redraw = False
@@ -1,137 +1,182 @@
 import pygame
-import random
 import math
-from pygame.sprite import Sprite
+from entity import Entity
+from assets import AssetError
+from event_log import DEBUG, WARNING, ERROR
+from sprite_cache import RotationAtlas
 
-class Rock(Sprite):
+class Rock(Entity):
     """A class to represent a single rock in the fleet."""
     
+    # Rocks keep only their own state; the screen, settings and generators
+    # are reached through the game, and images through the shared caches
+    __slots__ = ('game', 'rect', 'collision_rect', 'image', 'image_index', 'scale_factor',
+                 'rotation_angle', 'rotation_speed', 'x', 'y', 'prev_x', 'prev_y',
+                 'velocity_x', 'velocity_y', 'speed', 'has_been_visible')
+    
+    collision_padding = 20  # Pixels to shrink from each side for rocks
+    
     # Class variable to store preloaded images
+    image_paths = ['images/rock1.png', 'images/rock2.png']
     rock_images = []
     
+    # Shared cache of pre-rotated frames for every rock image and scale
+    atlas = None
+    fallback_image = None
+    
     @classmethod
-    def load_images(cls):
+    def load_images(cls, assets, events):
         """Load all rock images once at the start of the game."""
         if not cls.rock_images:  # Only load if not already loaded
-            image_paths = ['images/rock1.png', 'images/rock2.png']
-            for path in image_paths:
+            for path in cls.image_paths:
                 try:
-                    image = pygame.image.load(path)
-                    cls.rock_images.append(image)
-                    print(f"Imagen cargada: {path}")
-                except pygame.error as e:
-                    print(f"Error cargando imagen {path}: {e}")
+                    cls.rock_images.append(assets.get_image(path))
+                    events.log('image_loaded', level=DEBUG, path=path)
+                except AssetError as e:
+                    events.log('image_load_failed', level=ERROR, path=path, error=str(e))
             
             if not cls.rock_images:
-                print("¡Error! No se pudieron cargar las imágenes de rocas")
+                events.log('rock_images_missing', level=ERROR)
+    
+    @classmethod
+    def get_atlas(cls, settings):
+        """Return the shared rotation atlas, creating it on first use."""
+        if cls.atlas is None:
+            cls.atlas = RotationAtlas(
+                angle_step=settings.rock_rotation_step,
+                scale_step=settings.rock_scale_step,
+                max_bytes=settings.rock_atlas_budget_mb * 1024 * 1024
+            )
+        return cls.atlas
+    
+    @classmethod
+    def _get_fallback_image(cls):
+        """Return the plain gray image used when no rock image could be loaded."""
+        if cls.fallback_image is None:
+            cls.fallback_image = pygame.Surface((50, 50))  # Create a simple rectangle as fallback
+            cls.fallback_image.fill((128, 128, 128))  # Gray color
+        return cls.fallback_image
     
     def __init__(self, ai_game):
         """Initialize the rock and set its starting position."""
-        super().__init__()
-        self.screen = ai_game.screen
-        self.settings = ai_game.settings
-        self.ai_game = ai_game  # Reference to game for difficulty calculation
+        self.game = ai_game
 
         # Ensure images are loaded
-        Rock.load_images()
+        Rock.load_images(ai_game.assets, ai_game.events)
         
+        # Rects are allocated once and reused every time the rock is recycled
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.collision_rect = pygame.Rect(0, 0, 0, 0)
+        
+        self.reset()
+    
+    def reset(self):
+        """Re-randomize the rock's image, position and direction for a new spawn.
+
+        The layout is drawn from the game's spawn generator, so games can be
+        replayed however far ahead the spawner prepares rocks.
+        """
+        settings = self.game.settings
+        rng = self.game.spawn_rng
+
         # Select a random rock image from preloaded images and determine which one
         if Rock.rock_images:
             # Randomly select an image index
-            image_index = random.randint(0, len(Rock.rock_images) - 1)
-            original_image = Rock.rock_images[image_index].copy()
+            image_index = rng.randint(0, len(Rock.rock_images) - 1)
+            source_image = Rock.rock_images[image_index]
             
             # Determine scale range based on which image was selected
             if image_index == 0:  # rock1.png (first image)
-                scale_min = self.settings.rock1_scale_min
-                scale_max = self.settings.rock1_scale_max
+                scale_min = settings.rock1_scale_min
+                scale_max = settings.rock1_scale_max
             else:  # rock2.png (second image) - reduce size since it's too big
-                scale_min = self.settings.rock2_scale_min
-                scale_max = self.settings.rock2_scale_max
+                scale_min = settings.rock2_scale_min
+                scale_max = settings.rock2_scale_max
         else:
             # Fallback in case images couldn't be loaded
-            print("¡Advertencia! Usando imagen por defecto")
-            original_image = pygame.Surface((50, 50))  # Create a simple rectangle as fallback
-            original_image.fill((128, 128, 128))  # Gray color
+            self.game.events.log('rock_fallback_image', level=WARNING)
+            image_index = -1
+            source_image = Rock._get_fallback_image()
             scale_min = 0.6
             scale_max = 1.4
         
-        # Apply random scaling based on selected image
-        scale_factor = random.uniform(scale_min, scale_max)
-        original_width = original_image.get_width()
-        original_height = original_image.get_height()
-        new_width = int(original_width * scale_factor)
-        new_height = int(original_height * scale_factor)
-        scaled_image = pygame.transform.scale(original_image, (new_width, new_height))
+        # Apply random scaling based on selected image, snapped to a shared atlas bucket
+        atlas = Rock.get_atlas(settings)
+        scale_factor = atlas.quantize_scale(rng.uniform(scale_min, scale_max))
+        self.image_index = image_index
+        self.scale_factor = scale_factor
         
         # Apply random rotation (0 to 360 degrees)
-        initial_rotation = random.uniform(0, 360)
-        self.image = pygame.transform.rotate(scaled_image, initial_rotation)
+        initial_rotation = rng.uniform(0, 360)
+        self.image = atlas.get_frame(source_image, image_index, scale_factor, initial_rotation)
         
-        # Store original image and rotation info for continuous rotation
-        self.original_image = scaled_image
+        # Store rotation info for continuous rotation
         self.rotation_angle = initial_rotation
-        self.rotation_speed = random.uniform(
-            self.settings.rock_rotation_speed_min,
-            self.settings.rock_rotation_speed_max
+        self.rotation_speed = rng.uniform(
+            settings.rock_rotation_speed_min,
+            settings.rock_rotation_speed_max
         )  # Random rotation speed from settings
         
-        self.rect = self.image.get_rect()
+        self.rect.topleft = (0, 0)
+        self.rect.size = self.image.get_size()
         
-        # Create a smaller collision rect for more accurate collision detection
-        self.collision_padding = 20  # Pixels to shrink from each side for rocks
-        self.collision_rect = pygame.Rect(0, 0, 
-                                        self.rect.width - (self.collision_padding * 2),
-                                        self.rect.height - (self.collision_padding * 2))
+        # Size a smaller collision rect for more accurate collision detection
+        self.collision_rect.size = (self.rect.width - (self.collision_padding * 2),
+                                    self.rect.height - (self.collision_padding * 2))
         
         # Set random starting position on screen edge and direction
-        self._set_random_spawn_position()
+        self._set_random_spawn_position(rng)
         
         # Store the rock's exact position as floats.
         self.x = float(self.rect.x)
         self.y = float(self.rect.y)
+        self.prev_x = self.x
+        self.prev_y = self.y
         
-        # Update collision rect initial position
-        self.collision_rect.center = (self.x, self.y)
-        
-        # Set random speed based on current difficulty level
-        min_speed, max_speed = ai_game.get_current_rock_speed_range()
-        self.speed = random.uniform(min_speed, max_speed)
+        # Center the rects on the exact position, as every update will
+        self.apply_pose()
+        self.speed = 0.0
+        self.has_been_visible = False
+    
+    def launch(self):
+        """Give the rock a random speed for the current difficulty level as it enters the game."""
+        min_speed, max_speed = self.game.get_current_rock_speed_range()
+        self.speed = self.game.rng.uniform(min_speed, max_speed)
         
         # Track if rock has been visible on screen (to prevent counting spawn-escaped rocks)
         self.has_been_visible = False
     
-    def _set_random_spawn_position(self):
+    def _set_random_spawn_position(self, rng):
         """Set rock to spawn randomly on any screen edge with random direction."""
-        screen_width = self.settings.screen_width
-        screen_height = self.settings.screen_height
+        screen_width = self.game.settings.screen_width
+        screen_height = self.game.settings.screen_height
         
         # Choose random edge: 0=top, 1=right, 2=bottom, 3=left
-        edge = random.randint(0, 3)
+        edge = rng.randint(0, 3)
         
         if edge == 0:  # Top edge
-            self.rect.x = random.randint(0, screen_width - self.rect.width)
+            self.rect.x = rng.randint(0, screen_width - self.rect.width)
             self.rect.y = -self.rect.height
             # Direction towards screen (downward bias)
-            angle = random.uniform(45, 135)  # 45° to 135° (pointing down-ish)
+            angle = rng.uniform(45, 135)  # 45° to 135° (pointing down-ish)
             
         elif edge == 1:  # Right edge
             self.rect.x = screen_width
-            self.rect.y = random.randint(0, screen_height - self.rect.height)
+            self.rect.y = rng.randint(0, screen_height - self.rect.height)
             # Direction towards screen (leftward bias)
-            angle = random.uniform(135, 225)  # 135° to 225° (pointing left-ish)
+            angle = rng.uniform(135, 225)  # 135° to 225° (pointing left-ish)
             
         elif edge == 2:  # Bottom edge
-            self.rect.x = random.randint(0, screen_width - self.rect.width)
+            self.rect.x = rng.randint(0, screen_width - self.rect.width)
             self.rect.y = screen_height
             # Direction towards screen (upward bias)
-            angle = random.uniform(225, 315)  # 225° to 315° (pointing up-ish)
+            angle = rng.uniform(225, 315)  # 225° to 315° (pointing up-ish)
             
         else:  # Left edge
             self.rect.x = -self.rect.width
-            self.rect.y = random.randint(0, screen_height - self.rect.height)
+            self.rect.y = rng.randint(0, screen_height - self.rect.height)
             # Direction towards screen (rightward bias)
-            angle = random.uniform(315, 405) % 360  # 315° to 45° (pointing right-ish)
+            angle = rng.uniform(315, 405) % 360  # 315° to 45° (pointing right-ish)
         
         # Convert angle to velocity components
         radians = math.radians(angle)
@@ -140,6 +185,10 @@ class Rock(Sprite):
     
     def update(self):
         """Update the rock's position and rotation."""
+        # Remember where the rock was for interpolated drawing
+        self.prev_x = self.x
+        self.prev_y = self.y
+        
         # Move the rock based on its velocity and speed
         self.x += self.velocity_x * self.speed
         self.y += self.velocity_y * self.speed
@@ -148,31 +197,53 @@ class Rock(Sprite):
         self.rotation_angle += self.rotation_speed
         self.rotation_angle = self.rotation_angle % 360  # Keep angle in 0-360 range
         
-        # Apply rotation to the image
-        center = (self.x, self.y)
-        self.image = pygame.transform.rotate(self.original_image, self.rotation_angle)
-        self.rect = self.image.get_rect(center=center)
-        
-        # Update collision rect to stay centered with the rock
-        self.collision_rect.center = center
-        
-        # Update position
-        self.x = center[0]
-        self.y = center[1]
+        # Refresh the image and rects for the new position and angle
+        self.apply_pose()
         
         # Check if rock is now visible on screen
         if not self.has_been_visible:
             self.has_been_visible = self.is_visible_on_screen()
     
+    def apply_pose(self):
+        """Show the pre-rotated frame for the current angle, centered on (x, y)."""
+        center = (self.x, self.y)
+        self.image = Rock.atlas.get_frame(self._get_source_image(), self.image_index,
+                                          self.scale_factor, self.rotation_angle)
+        self.rect.size = self.image.get_size()
+        self.rect.center = center
+        
+        # Update collision rect to stay centered with the rock
+        self.collision_rect.center = center
+    
+    def get_mask(self, angle=None):
+        """Return the collision mask of the rock's frame at angle (default: its current angle)."""
+        if angle is None:
+            angle = self.rotation_angle
+        return Rock.atlas.get_mask(self._get_source_image(), self.image_index,
+                                   self.scale_factor, angle)
+    
+    def get_base_size(self):
+        """Return the size of the rock's unrotated image at its scale."""
+        return Rock.atlas.get_base_image(self._get_source_image(), self.image_index,
+                                         self.scale_factor).get_size()
+    
+    def _get_source_image(self):
+        """Return the loaded image the rock's frames are made from."""
+        if self.image_index < 0:
+            return Rock._get_fallback_image()
+        return Rock.rock_images[self.image_index]
+    
     def is_visible_on_screen(self):
         """Check if any part of the rock is visible on screen."""
-        return (self.rect.right > 0 and self.rect.left < self.settings.screen_width and
-                self.rect.bottom > 0 and self.rect.top < self.settings.screen_height)
+        settings = self.game.settings
+        return (self.rect.right > 0 and self.rect.left < settings.screen_width and
+                self.rect.bottom > 0 and self.rect.top < settings.screen_height)
     
     def is_off_screen(self):
         """Check if the rock has moved completely off screen."""
-        return (self.rect.right < 0 or self.rect.left > self.settings.screen_width or
-                self.rect.bottom < 0 or self.rect.top > self.settings.screen_height)
+        settings = self.game.settings
+        return (self.rect.right < 0 or self.rect.left > settings.screen_width or
+                self.rect.bottom < 0 or self.rect.top > settings.screen_height)
     
     def has_escaped(self):
         """Check if the rock has truly escaped (was visible and now off screen)."""
@@ -0,0 +1,141 @@
+"""
+ScoreStore class to keep the results of every game on disk.
+This module stores each finished game's statistics in an indexed SQLite
+database, written by a background thread so the game never waits on the
+disk, and answers leaderboard queries.
+"""
+
+import queue
+import sqlite3
+import threading
+import time
+
+# Columns of a stored game, in the order of get_stats_summary()
+_COLUMNS = ('score', 'rocks_destroyed', 'rocks_escaped', 'time_seconds', 'difficulty_level',
+            'total_bullets_fired', 'accuracy', 'rock_speed_min', 'rock_speed_max', 'ships_left')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id INTEGER PRIMARY KEY,
+    played_at REAL NOT NULL,
+    score INTEGER NOT NULL,
+    rocks_destroyed INTEGER NOT NULL,
+    rocks_escaped INTEGER NOT NULL,
+    time_seconds INTEGER NOT NULL,
+    difficulty_level INTEGER NOT NULL,
+    total_bullets_fired INTEGER NOT NULL,
+    accuracy REAL NOT NULL,
+    rock_speed_min REAL NOT NULL,
+    rock_speed_max REAL NOT NULL,
+    ships_left INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS sessions_by_score ON sessions (score DESC);
+CREATE INDEX IF NOT EXISTS sessions_by_level ON sessions (difficulty_level, score DESC);
+CREATE INDEX IF NOT EXISTS sessions_by_time ON sessions (played_at);
+"""
+
+
+class ScoreStore:
+    """A persistent history of finished games with leaderboard queries."""
+
+    def __init__(self, path):
+        """Open (or create) the database at path and start the writer thread."""
+        self.path = path
+        self._connection = sqlite3.connect(path)
+        self._connection.row_factory = sqlite3.Row
+        self._connection.execute('PRAGMA journal_mode=WAL')  # Readers don't wait on the writer
+        self._connection.executescript(_SCHEMA)
+        self._connection.commit()
+
+        # Games submitted but not yet written, so queries already include them
+        self._pending = []
+        self._lock = threading.Lock()
+
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name='score-store', daemon=True)
+        self._thread.start()
+
+    def submit(self, summary, played_at=None):
+        """Queue a game's get_stats_summary() for writing and return its row."""
+        speed_min, speed_max = summary['rock_speed_range']
+        row = {
+            'played_at': played_at if played_at is not None else time.time(),
+            'score': summary['score'],
+            'rocks_destroyed': summary['rocks_destroyed'],
+            'rocks_escaped': summary['rocks_escaped'],
+            'time_seconds': summary['time_seconds'],
+            'difficulty_level': summary['difficulty_level'],
+            'total_bullets_fired': summary['total_bullets_fired'],
+            'accuracy': summary['accuracy'],
+            'rock_speed_min': speed_min,
+            'rock_speed_max': speed_max,
+            'ships_left': summary['ships_left']
+        }
+        with self._lock:
+            self._pending.append(row)
+        self._queue.put(row)
+        return row
+
+    def top_scores(self, limit=10, level=None):
+        """Return the best games as dicts, optionally only those that ended at difficulty level."""
+        # Look at the pending games first: one written in the meantime then
+        # shows up in both lists and is de-duplicated, instead of in neither
+        pending = self._pending_rows(level)
+        if level is None:
+            rows = self._connection.execute(
+                'SELECT * FROM sessions ORDER BY score DESC, played_at LIMIT ?', (limit,))
+        else:
+            rows = self._connection.execute(
+                'SELECT * FROM sessions WHERE difficulty_level = ? '
+                'ORDER BY score DESC, played_at LIMIT ?', (level, limit))
+        games = [dict(row) for row in rows]
+
+        if pending:
+            stored = {game['played_at'] for game in games}
+            games.extend(row for row in pending if row['played_at'] not in stored)
+            games.sort(key=lambda game: (-game['score'], game['played_at']))
+            del games[limit:]
+        return games
+
+    def best_by_level(self):
+        """Return {difficulty level: best score} over every stored game."""
+        pending = self._pending_rows()
+        rows = self._connection.execute(
+            'SELECT difficulty_level, MAX(score) FROM sessions GROUP BY difficulty_level')
+        best = dict(rows.fetchall())
+        for row in pending:
+            level = row['difficulty_level']
+            best[level] = max(best.get(level, row['score']), row['score'])
+        return best
+
+    def _pending_rows(self, level=None):
+        """Return a copy of the games not yet written, optionally only those at level."""
+        with self._lock:
+            return [row for row in self._pending
+                    if level is None or row['difficulty_level'] == level]
+
+    def close(self):
+        """Write every queued game and close the database."""
+        self._queue.put(None)
+        self._thread.join()
+        self._connection.close()
+
+    def _run(self):
+        """Write queued games until close() is called."""
+        # SQLite connections belong to the thread that opened them
+        connection = sqlite3.connect(self.path)
+        insert = (f"INSERT INTO sessions (played_at, {', '.join(_COLUMNS)}) "
+                  f"VALUES ({', '.join('?' * (len(_COLUMNS) + 1))})")
+        while True:
+            row = self._queue.get()
+            if row is None:
+                break
+            try:
+                with connection:
+                    connection.execute(insert, [row['played_at']] +
+                                       [row[column] for column in _COLUMNS])
+            except sqlite3.Error:
+                continue  # Keep the game in the pending list for this session
+            with self._lock:
+                self._pending.remove(row)
+        connection.close()
@@ -5,6 +5,9 @@ This module handles all visual display of scores, stats, and game info.
 
 import pygame
 
+from ship import Ship
+from text_atlas import GlyphAtlas
+
 class Scoreboard:
     """A class to report scoring information."""
     
@@ -18,12 +21,45 @@ class Scoreboard:
         
         # Font settings for displaying scoring information.
         self.text_color = (255, 255, 255)  # White text
-        self.font = pygame.font.Font(None, 36)
-        self.small_font = pygame.font.Font(None, 24)
+        self.font = ai_game.assets.get_font(36)
+        self.small_font = ai_game.assets.get_font(24)
+        self.game_over_font = ai_game.assets.get_font(72)
+        
+        # Glyph atlases compose the HUD values without rendering text each time
+        self.escaped_color = (255, 100, 100)  # Light red
+        self.glyphs = GlyphAtlas(self.font, self.text_color)
+        self.escaped_glyphs = GlyphAtlas(self.font, self.escaped_color)
+        self.small_glyphs = GlyphAtlas(self.small_font, self.text_color)
+        
+        # Ship image for lives display, shared with the ship through the asset manager
+        self.ship_image = ai_game.assets.get_scaled(Ship.image_path, (30, 30))
+        
+        # Fields of the HUD and the method that renders each one. A field is
+        # only re-rendered when its value changes.
+        self._hud_preps = {
+            'score': self.prep_score,
+            'level': self.prep_level,
+            'time': self.prep_time,
+            'rocks_destroyed': self.prep_rocks_destroyed,
+            'rocks_escaped': self.prep_rocks_escaped,
+            'accuracy': self.prep_accuracy,
+            'rock_speed': self.prep_rock_speed,
+            'bullets_fired': self.prep_bullets_info,
+            'current_bullets': self.prep_current_bullets,
+            'ships': self.prep_ships
+        }
+        self._hud_values = {}
+        self._hud_dirty = True
         
-        # Load ship image for lives display
-        self.ship_image = pygame.image.load('images/fighter.png')
-        self.ship_image = pygame.transform.scale(self.ship_image, (30, 30))  # Small size for lives display
+        # Respawn countdown digits, rendered once per number
+        self.countdown_font = ai_game.assets.get_font(120)
+        self._countdown_images = {}
+        
+        # Cached HUD panels: stats on the left, bullets on the right.
+        self.left_panel = None
+        self.left_panel_rect = pygame.Rect(0, 0, 0, 0)
+        self.right_panel = None
+        self.right_panel_rect = pygame.Rect(0, 0, 0, 0)
         
         # Prepare the initial score images.
         self.prep_score()
@@ -33,149 +69,212 @@ class Scoreboard:
         self.prep_rocks_escaped()
         self.prep_accuracy()
         self.prep_rock_speed()
+        self.prep_bullets_info()
         self.prep_ships()
     
     def prep_score(self):
         """Turn the score into a rendered image."""
         rounded_score = round(self.stats.score, -1)
-        score_str = f"Puntuación: {rounded_score:,}"
-        self.score_image = self.font.render(score_str, True, self.text_color)
+        self.score_image = self.glyphs.render(f"{rounded_score:,}", "Puntuación: ")
         
         # Display the score at the top left of the screen.
         self.score_rect = self.score_image.get_rect()
         self.score_rect.left = 10
         self.score_rect.top = 90
+        self._hud_dirty = True
     
     def prep_level(self):
         """Turn the level into a rendered image."""
         level = self.stats.current_difficulty_level + 1
-        level_str = f"Nivel: {level}"
-        self.level_image = self.font.render(level_str, True, self.text_color)
+        self.level_image = self.glyphs.render(str(level), "Nivel: ")
         
         # Position the level below the score.
         self.level_rect = self.level_image.get_rect()
         self.level_rect.left = 10
         self.level_rect.top = 50
+        self._hud_dirty = True
     
     def prep_time(self):
         """Turn the game time into a rendered image."""
         time_seconds = self.stats.get_game_time_seconds()
-        time_str = f"Tiempo: {time_seconds}s"
-        self.time_image = self.font.render(time_str, True, self.text_color)
+        self.time_image = self.glyphs.render(f"{time_seconds}s", "Tiempo: ")
         
         # Position the time at the top.
         self.time_rect = self.time_image.get_rect()
         self.time_rect.left = 10
         self.time_rect.top = 10
+        self._hud_dirty = True
     
     def prep_rocks_destroyed(self):
         """Turn the rocks destroyed count into a rendered image."""
-        rocks_str = f"Rocas destruidas: {self.stats.rocks_destroyed}"
-        self.rocks_image = self.font.render(rocks_str, True, self.text_color)
+        self.rocks_image = self.glyphs.render(str(self.stats.rocks_destroyed),
+                                              "Rocas destruidas: ")
         
         # Position below the score.
         self.rocks_rect = self.rocks_image.get_rect()
         self.rocks_rect.left = 10
         self.rocks_rect.top = 130
+        self._hud_dirty = True
     
     def prep_rocks_escaped(self):
         """Turn the rocks escaped count into a rendered image."""
-        rocks_escaped_str = f"Rocas escapadas: {self.stats.rocks_escaped}"
-        self.rocks_escaped_image = self.font.render(rocks_escaped_str, True, (255, 100, 100))  # Light red color
+        self.rocks_escaped_image = self.escaped_glyphs.render(str(self.stats.rocks_escaped),
+                                                              "Rocas escapadas: ")
         
         # Position below rocks destroyed.
         self.rocks_escaped_rect = self.rocks_escaped_image.get_rect()
         self.rocks_escaped_rect.left = 10
         self.rocks_escaped_rect.top = 170
+        self._hud_dirty = True
     
     def prep_accuracy(self):
         """Turn the accuracy percentage into a rendered image."""
-        accuracy_str = f"Precisión: {self.stats.accuracy:.1f}%"
-        self.accuracy_image = self.small_font.render(accuracy_str, True, self.text_color)
+        self.accuracy_image = self.small_glyphs.render(f"{self.stats.accuracy:.1f}%",
+                                                       "Precisión: ")
         
         # Position below rocks escaped.
         self.accuracy_rect = self.accuracy_image.get_rect()
         self.accuracy_rect.left = 10
         self.accuracy_rect.top = 210
+        self._hud_dirty = True
     
     def prep_rock_speed(self):
         """Turn the current rock speed range into a rendered image."""
         min_speed, max_speed = self.stats.get_current_rock_speed_range()
-        speed_str = f"Velocidad rocas: {min_speed:.1f}-{max_speed:.1f}"
-        self.speed_image = self.small_font.render(speed_str, True, self.text_color)
+        self.speed_image = self.small_glyphs.render(f"{min_speed:.1f}-{max_speed:.1f}",
+                                                    "Velocidad rocas: ")
         
         # Position below accuracy.
         self.speed_rect = self.speed_image.get_rect()
         self.speed_rect.left = 10
         self.speed_rect.top = 235
+        self._hud_dirty = True
     
     def prep_bullets_info(self):
         """Turn bullets information into a rendered image."""
         bullets_fired = self.stats.total_bullets_fired
-        bullets_str = f"Balas disparadas: {bullets_fired}"
-        self.bullets_image = self.small_font.render(bullets_str, True, self.text_color)
+        self.bullets_image = self.small_glyphs.render(str(bullets_fired), "Balas disparadas: ")
         
         # Position at the top right.
         self.bullets_rect = self.bullets_image.get_rect()
         self.bullets_rect.right = self.screen_rect.right - 10
         self.bullets_rect.top = 10
+        self._hud_dirty = True
     
     def prep_current_bullets(self):
         """Show current bullets available."""
         current_bullets = len(self.ai_game.bullets)
         max_bullets = self.settings.bullets_allowed
-        bullets_str = f"Balas: {current_bullets}/{max_bullets}"
-        self.current_bullets_image = self.small_font.render(bullets_str, True, self.text_color)
+        self.current_bullets_image = self.small_glyphs.render(
+            f"{current_bullets}/{max_bullets}", "Balas: ")
         
         # Position at the top right, below bullets fired.
         self.current_bullets_rect = self.current_bullets_image.get_rect()
         self.current_bullets_rect.right = self.screen_rect.right - 10
         self.current_bullets_rect.top = 35
+        self._hud_dirty = True
     
     def prep_ships(self):
         """Show how many ships are left."""
         self.ships = pygame.sprite.Group()
         for ship_number in range(self.stats.ships_left):
             ship = pygame.sprite.Sprite()
-            ship.image = self.ship_image.copy()
+            ship.image = self.ship_image  # Shared, never modified
             ship.rect = ship.image.get_rect()
             ship.rect.x = 10 + ship_number * 40  # Space ships 40 pixels apart
             ship.rect.y = 260  # Position below other stats
             self.ships.add(ship)
+        self._hud_dirty = True
     
     def show_score(self):
-        """Draw all score information to the screen."""
-        # Update all score elements
-        self.prep_score()
-        self.prep_level()
-        self.prep_time()
-        self.prep_rocks_destroyed()
-        self.prep_rocks_escaped()
-        self.prep_accuracy()
-        self.prep_rock_speed()
-        self.prep_bullets_info()
-        self.prep_current_bullets()
-        self.prep_ships()
+        """Draw all score information to the screen and return the areas drawn."""
+        # Re-render only the fields whose values changed since the last frame
+        self._refresh_hud()
         
-        # Draw all score information
-        self.screen.blit(self.score_image, self.score_rect)
-        self.screen.blit(self.level_image, self.level_rect)
-        self.screen.blit(self.time_image, self.time_rect)
-        self.screen.blit(self.rocks_image, self.rocks_rect)
-        self.screen.blit(self.rocks_escaped_image, self.rocks_escaped_rect)
-        self.screen.blit(self.accuracy_image, self.accuracy_rect)
-        self.screen.blit(self.speed_image, self.speed_rect)
-        self.screen.blit(self.bullets_image, self.bullets_rect)
-        self.screen.blit(self.current_bullets_image, self.current_bullets_rect)
+        # Draw the cached panels
+        return [
+            self.screen.blit(self.left_panel, self.left_panel_rect,
+                             special_flags=pygame.BLEND_PREMULTIPLIED),
+            self.screen.blit(self.right_panel, self.right_panel_rect,
+                             special_flags=pygame.BLEND_PREMULTIPLIED)
+        ]
+    
+    def show_respawn_countdown(self, ticks_left):
+        """Draw the seconds left before the ship respawns and return the area drawn."""
+        seconds = -(-ticks_left // self.settings.physics_tick_rate)  # Round up
+        image = self._countdown_images.get(seconds)
+        if image is None:
+            image = self.countdown_font.render(str(seconds), True, self.text_color)
+            self._countdown_images[seconds] = image
+        
+        # Show the number above the ship
+        rect = image.get_rect()
+        rect.centerx = self.screen_rect.centerx
+        rect.bottom = self.screen_rect.centery - 60
+        return self.screen.blit(image, rect)
+    
+    def _read_hud_values(self):
+        """Return the value currently shown by each HUD field."""
+        stats = self.stats
+        return {
+            'score': round(stats.score, -1),
+            'level': stats.current_difficulty_level,
+            'time': stats.get_game_time_seconds(),
+            'rocks_destroyed': stats.rocks_destroyed,
+            'rocks_escaped': stats.rocks_escaped,
+            'accuracy': round(stats.accuracy, 1),
+            'rock_speed': stats.get_current_rock_speed_range(),
+            'bullets_fired': stats.total_bullets_fired,
+            'current_bullets': (len(self.ai_game.bullets), self.settings.bullets_allowed),
+            'ships': stats.ships_left
+        }
+    
+    def _refresh_hud(self):
+        """Re-render changed fields and recompose the panels if anything changed."""
+        for field, value in self._read_hud_values().items():
+            if field not in self._hud_values or self._hud_values[field] != value:
+                self._hud_values[field] = value
+                self._hud_preps[field]()
+        
+        if self._hud_dirty:
+            self._compose_panels()
+            self._hud_dirty = False
+    
+    def _compose_panels(self):
+        """Draw every HUD image into the two cached panel surfaces."""
+        left_items = [
+            (self.score_image, self.score_rect),
+            (self.level_image, self.level_rect),
+            (self.time_image, self.time_rect),
+            (self.rocks_image, self.rocks_rect),
+            (self.rocks_escaped_image, self.rocks_escaped_rect),
+            (self.accuracy_image, self.accuracy_rect),
+            (self.speed_image, self.speed_rect)
+        ]
+        left_items.extend((ship.image, ship.rect) for ship in self.ships)
+        right_items = [
+            (self.bullets_image, self.bullets_rect),
+            (self.current_bullets_image, self.current_bullets_rect)
+        ]
+        
+        self.left_panel, self.left_panel_rect = self._compose_panel(left_items)
+        self.right_panel, self.right_panel_rect = self._compose_panel(right_items)
+    
+    def _compose_panel(self, items):
+        """Blit items into a transparent panel covering all of their rects."""
+        panel_rect = items[0][1].unionall([rect for _, rect in items[1:]])
+        panel = pygame.Surface(panel_rect.size, pygame.SRCALPHA)
+        for image, rect in items:
+            panel.blit(image, rect.move(-panel_rect.x, -panel_rect.y))
         
-        # Draw the ships (lives)
-        self.ships.draw(self.screen)
+        # Premultiplied panels blend onto the screen about twice as fast
+        return panel.premul_alpha(), panel_rect
     
     def show_game_over_screen(self):
         """Display game over statistics."""
         # Create game over title
         game_over_str = "GAME OVER"
-        game_over_image = pygame.font.Font(None, 72).render(
+        game_over_image = self.game_over_font.render(
             game_over_str, True, (255, 0, 0)
         )
         game_over_rect = game_over_image.get_rect()
@@ -7,11 +7,52 @@ class Settings:
         self.screen_width = 1200
         self.screen_height = 800
         self.bg_color = (0, 0, 20)  # Dark space blue
+        
+        # Timing settings
+        self.physics_tick_rate = 60  # Fixed simulation steps per second
+        self.max_render_fps = 144  # Frame cap for rendering (0 = uncapped)
+        self.max_catchup_steps = 5  # Most simulation steps run before rendering a frame
+        self.interpolate_rendering = True  # Draw sprites between the last two simulation steps
+        
+        # Profiler settings
+        self.profiler_enabled = False  # Time each phase of the game loop (F3 shows the overlay)
+        self.profiler_window = 600  # Frames kept for the rolling percentiles
+        self.profiler_export_path = 'frame_profile.json'  # Written on exit (.csv or .json)
+        self.print_startup_report = True  # Print how long each startup phase took
+        
+        # Replay settings
+        self.random_seed = None  # Seed for the games' seeds (None = different every run)
+        self.replay_dir = 'replays'  # Where finished games are recorded (None = don't record)
+        
+        # Event log settings
+        self.event_log_path = 'logs/events.jsonl'  # JSON Lines file (None = no event log)
+        self.event_log_level = 'info'  # Lowest level written: debug, info, warning or error
+        self.event_log_capacity = 4096  # Events buffered before the oldest are overwritten
+        self.event_log_max_bytes = 1024 * 1024  # Rotate the file past this size
+        self.event_log_backups = 3  # Rotated files kept (events.jsonl.1 ...)
+        self.event_log_echo = False  # Also print events (from the writer thread)
+        
+        # Score history settings
+        self.score_db_path = 'scores.db'  # SQLite file with every finished game (None = don't keep)
+        self.leaderboard_size = 5  # Best games shown on the game over screen
+        
+        # Sound settings
+        self.sound_enabled = True  # Play sound effects (simulated games never do)
+        self.sound_volume = 0.6  # Master volume, 0.0 - 1.0
+        self.sound_channels = 8  # Mixer channels shared by every effect
+        self.sound_buffer = 512  # Mixer buffer in samples (smaller = less latency)
+        self.sound_dir = 'sounds'  # <effect>.wav/.ogg here replace the synthesized effects
+        
+        # Rendering settings
+        self.dirty_rect_rendering = False  # Only update the changed parts of the screen
+        self.dirty_rect_full_flip_ratio = 0.5  # Flip the whole screen above this dirty fraction
 
         # Ship settings
         self.ship_speed = 1.5
-        self.ship_rotation_speed = 2.5  # Degrees per frame
+        self.ship_rotation_speed = 2.5  # Degrees per tick
         self.ship_lives = 3  # Number of lives the player has
+        self.respawn_countdown_ticks = 60  # Ticks the game holds after a hit (1 second, as before)
+        self.respawn_invulnerable_ticks = 120  # Ticks the respawned ship can't be hit
 
         # # Bullet settings
         self.bullet_speed = 4.5
@@ -21,8 +62,21 @@ class Settings:
         self.bullets_allowed = 5
 
         # Rock settings
-        self.rock_spawn_rate = 120  # Frames between rock spawns (2 seconds at 60 FPS)
+        self.rock_spawn_rate = 120  # Ticks between rock spawns (2 seconds at 60 ticks/s)
         self.max_rocks = 10  # Maximum number of rocks on screen (increased 25% from 8)
+        self.rock_wave_interval = 0  # Ticks between waves of rocks (0 = steady spawns only)
+        self.rock_wave_size = 6  # Rocks in a wave
+        self.rock_wave_spacing = 8  # Ticks between the rocks of a wave (0 = all at once, a burst)
+        self.rock_spawn_max_per_tick = 4  # Most rocks launched in one tick; the rest follow
+        self.rock_spawn_queue_size = 6  # Rocks prepared ahead of time
+        self.rock_spawn_budget_ms = 1.0  # Time per frame spent preparing rocks
+        
+        # Physics settings
+        self.physics_backend = 'python'  # 'python' (per sprite) or 'numpy' (batched arrays)
+        
+        # Collision settings
+        self.collision_cell_size = 128  # Pixels per spatial hash cell for the broad phase
+        self.precise_collisions = False  # Pixel masks after the rect broad phase (off = padded rects only)
         
         # Scoring settings
         self.rock_escaped_penalty = -5  # Points lost when a rock escapes
@@ -36,12 +90,17 @@ class Settings:
         self.rock2_scale_min = 0.2  # Minimum scale factor (40% of original)
         self.rock2_scale_max = 0.4  # Maximum scale factor (80% of original)
         
-        self.rock_rotation_speed_min = -2.0  # Minimum rotation speed (degrees per frame)
-        self.rock_rotation_speed_max = 2.0   # Maximum rotation speed (degrees per frame)
+        self.rock_rotation_speed_min = -2.0  # Minimum rotation speed (degrees per tick)
+        self.rock_rotation_speed_max = 2.0   # Maximum rotation speed (degrees per tick)
+        
+        # Rock rotation atlas settings
+        self.rock_rotation_step = 3.0  # Degrees between pre-rotated frames
+        self.rock_scale_step = 0.05  # Scale factors are snapped to buckets this fraction apart
+        self.rock_atlas_budget_mb = 64  # Memory budget for cached rock frames (LRU evicted)
         
         # Difficulty progression settings
         self.base_rock_speed_min = 1.0  # Minimum speed at start
         self.base_rock_speed_max = 2.0  # Maximum speed at start
-        self.difficulty_increase_time = 1200  # Frames (30 seconds at 60 FPS)
+        self.difficulty_increase_time = 1200  # Simulation ticks (30 seconds at 60 ticks/s)
         self.speed_multiplier_per_level = 0.4  # How much faster each level
         self.max_difficulty_level = 15  # Maximum difficulty level
\ No newline at end of file
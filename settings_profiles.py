@@ -0,0 +1,245 @@
+"""
+Settings profiles loaded from TOML or JSON files.
+This module validates profile files against the defaults in Settings, loads
+named profiles from the profiles directory and watches a profile file so
+changed values can be applied to a running game.
+"""
+
+import json
+import os
+import time
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11 has no TOML parser; JSON profiles still work
+    tomllib = None
+
+from settings import Settings
+
+PROFILE_DIR = 'profiles'
+
+# Allowed ranges (inclusive; None = unbounded) of numeric settings
+LIMITS = {
+    'screen_width': (320, 7680),
+    'screen_height': (240, 4320),
+    'physics_tick_rate': (10, 1000),
+    'max_render_fps': (0, 1000),
+    'max_catchup_steps': (1, 60),
+    'profiler_window': (1, 100000),
+    'dirty_rect_full_flip_ratio': (0.0, 1.0),
+    'event_log_capacity': (16, None),
+    'event_log_max_bytes': (1024, None),
+    'event_log_backups': (0, 100),
+    'leaderboard_size': (0, 100),
+    'sound_volume': (0.0, 1.0),
+    'sound_channels': (1, 64),
+    'sound_buffer': (64, 8192),
+    'ship_speed': (0.0, None),
+    'ship_rotation_speed': (0.0, 360.0),
+    'ship_lives': (1, 99),
+    'respawn_countdown_ticks': (0, None),
+    'respawn_invulnerable_ticks': (0, None),
+    'bullet_speed': (0.1, None),
+    'bullet_width': (1, 1000),
+    'bullet_height': (1, 1000),
+    'bullets_allowed': (0, 100000),
+    'rock_spawn_rate': (1, None),
+    'max_rocks': (0, 100000),
+    'rock_wave_interval': (0, None),
+    'rock_wave_size': (1, 10000),
+    'rock_wave_spacing': (0, None),
+    'rock_spawn_max_per_tick': (1, 10000),
+    'rock_spawn_queue_size': (0, 10000),
+    'rock_spawn_budget_ms': (0.0, 100.0),
+    'collision_cell_size': (8, 4096),
+    'rock1_scale_min': (0.05, 10.0),
+    'rock1_scale_max': (0.05, 10.0),
+    'rock2_scale_min': (0.05, 10.0),
+    'rock2_scale_max': (0.05, 10.0),
+    'rock_rotation_step': (0.5, 90.0),
+    'rock_scale_step': (0.0, 1.0),
+    'rock_atlas_budget_mb': (1, 16384),
+    'base_rock_speed_min': (0.0, None),
+    'base_rock_speed_max': (0.0, None),
+    'difficulty_increase_time': (1, None),
+    'speed_multiplier_per_level': (0.0, None),
+    'max_difficulty_level': (0, 1000)
+}
+
+# Settings limited to a few values
+CHOICES = {
+    'physics_backend': ('python', 'numpy'),
+    'event_log_level': ('debug', 'info', 'warning', 'error')
+}
+
+# Settings that may be turned off; profiles use "" (or JSON null) for None
+NULLABLE = {'random_seed', 'replay_dir', 'event_log_path', 'score_db_path',
+            'profiler_export_path'}
+
+# Pairs that must satisfy first <= second
+ORDERED_PAIRS = [
+    ('rock1_scale_min', 'rock1_scale_max'),
+    ('rock2_scale_min', 'rock2_scale_max'),
+    ('rock_rotation_speed_min', 'rock_rotation_speed_max'),
+    ('base_rock_speed_min', 'base_rock_speed_max')
+]
+
+# Settings a running game can't pick up; a reload leaves them alone
+RESTART_ONLY = {
+    'screen_width', 'screen_height', 'physics_tick_rate', 'physics_backend', 'random_seed',
+    'replay_dir', 'event_log_path', 'event_log_capacity', 'event_log_max_bytes',
+    'event_log_backups', 'event_log_echo', 'score_db_path', 'profiler_window',
+    'bullet_width', 'bullet_height', 'sound_enabled', 'sound_channels', 'sound_buffer',
+    'sound_dir'
+}
+
+
+class SettingsError(ValueError):
+    """A profile holds unknown or invalid settings."""
+
+    def __init__(self, problems):
+        """Store every problem found."""
+        self.problems = problems
+        super().__init__('; '.join(problems))
+
+
+def resolve_profile(name):
+    """Return the path of a profile given by path or by name in PROFILE_DIR."""
+    if os.path.exists(name):
+        return name
+    for extension in ('.toml', '.json'):
+        path = os.path.join(PROFILE_DIR, name + extension)
+        if os.path.exists(path):
+            return path
+    raise FileNotFoundError(f"No profile '{name}' (looked for {name} and {PROFILE_DIR}/{name}.toml/.json)")
+
+
+def read_profile(path):
+    """Read a profile file and return its validated values."""
+    if path.endswith('.toml'):
+        if tomllib is None:
+            raise SettingsError([f"{path}: TOML profiles need Python 3.11 or newer"])
+        with open(path, 'rb') as file:
+            values = tomllib.load(file)
+    else:
+        with open(path) as file:
+            values = json.load(file)
+    return validate(values)
+
+
+def load_settings(name):
+    """Return Settings with the named profile applied on top of the defaults."""
+    settings = Settings()
+    for key, value in read_profile(resolve_profile(name)).items():
+        setattr(settings, key, value)
+    return settings
+
+
+def validate(values):
+    """Check values against the defaults' types and the limits above.
+
+    Returns the values converted to the types Settings uses (lists to
+    tuples, ints to floats, "" to None). Raises SettingsError listing every
+    problem.
+    """
+    defaults = vars(Settings())
+    problems = []
+    result = {}
+    for key, value in values.items():
+        if key not in defaults:
+            problems.append(f"unknown setting '{key}'")
+            continue
+        try:
+            result[key] = _convert(key, value, defaults[key])
+        except ValueError as e:
+            problems.append(f"{key}: {e}")
+
+    merged = dict(defaults, **result)
+    for low, high in ORDERED_PAIRS:
+        if low in merged and high in merged and merged[low] > merged[high]:
+            problems.append(f"{low} ({merged[low]}) is greater than {high} ({merged[high]})")
+
+    if problems:
+        raise SettingsError(problems)
+    return result
+
+
+def _convert(key, value, default):
+    """Convert one value to the type of its default, or raise ValueError."""
+    if key in NULLABLE and (value is None or value == ''):
+        return None
+
+    if isinstance(default, bool):
+        if not isinstance(value, bool):
+            raise ValueError(f"expected true or false, got {value!r}")
+        return value
+    if isinstance(default, tuple):
+        if (not isinstance(value, (list, tuple)) or len(value) != len(default) or
+                not all(isinstance(part, int) and 0 <= part <= 255 for part in value)):
+            raise ValueError(f"expected a list of {len(default)} integers from 0 to 255")
+        return tuple(value)
+    if isinstance(default, str) or (default is None and isinstance(value, str)):
+        if not isinstance(value, str):
+            raise ValueError(f"expected a string, got {value!r}")
+        choices = CHOICES.get(key)
+        if choices and value not in choices:
+            raise ValueError(f"expected one of {', '.join(choices)}, got {value!r}")
+        return value
+
+    # Numbers
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise ValueError(f"expected a number, got {value!r}")
+    if isinstance(default, int) or default is None:
+        if not isinstance(value, int):
+            raise ValueError(f"expected an integer, got {value!r}")
+    else:
+        value = float(value)
+    low, high = LIMITS.get(key, (None, None))
+    if (low is not None and value < low) or (high is not None and value > high):
+        raise ValueError(f"{value} is outside {low}..{high if high is not None else ''}")
+    return value
+
+
+class ProfileWatcher:
+    """Notice when a profile file changes and report the values that changed."""
+
+    def __init__(self, path, interval=1.0):
+        """Watch path, looking at its modification time at most every interval seconds."""
+        self.path = path
+        self.interval = interval
+        self._mtime = self._get_mtime()
+        self._next_check = time.monotonic() + interval
+        self.values = read_profile(path)  # Values of the last valid version
+
+    def poll(self):
+        """Return {name: value} of the settings that changed since the last poll, else None.
+
+        A setting removed from the profile goes back to its default. Raises
+        SettingsError (or OSError) if the changed file is invalid; the next
+        change is picked up again.
+        """
+        now = time.monotonic()
+        if now < self._next_check:
+            return None
+        self._next_check = now + self.interval
+
+        mtime = self._get_mtime()
+        if mtime is None or mtime == self._mtime:
+            return None
+        self._mtime = mtime
+        values = read_profile(self.path)
+
+        defaults = vars(Settings())
+        changes = {key: value for key, value in values.items()
+                   if self.values.get(key, defaults[key]) != value}
+        changes.update((key, defaults[key]) for key in self.values
+                       if key not in values and self.values[key] != defaults[key])
+        self.values = values
+        return changes or None
+
+    def _get_mtime(self):
+        """Return the file's modification time, or None if it can't be read."""
+        try:
+            return os.stat(self.path).st_mtime_ns
+        except OSError:
+            return None
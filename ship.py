@@ -5,6 +5,8 @@ import math
 class Ship:
     """A class to manage the ship."""
 
+    image_path = 'images/fighter.png'
+
     def __init__(self, ai_game):
         """Initialize the ship and set its starting position."""
         self.screen = ai_game.screen
@@ -12,7 +14,7 @@ class Ship:
         self.screen_rect = ai_game.screen.get_rect()
 
         # Load the ship image and get its rect.
-        self.original_image = pygame.image.load('images/fighter.png').convert_alpha()
+        self.original_image = ai_game.assets.get_image(Ship.image_path)
         self.image = self.original_image
         self.rect = self.image.get_rect()
 
@@ -28,18 +30,46 @@ class Ship:
         # Store a float for the ship's exact position.
         self.x = float(self.rect.centerx)
         self.y = float(self.rect.centery)
+        self.prev_x = self.x
+        self.prev_y = self.y
 
         # Rotation attributes
         self.angle = 0  # Degrees (0 = pointing right, 90 = pointing down, etc.)
+        
+        # Rotated images keyed by angle, kept for the ship's whole life (every
+        # game and respawn reuses them) so the image is only swapped when the
+        # angle changes, never rotated again
+        self._frames = {}
+        self.max_cached_frames = 720
+        self._prerotate()
+        self._image_angle = self.angle
+        self.image = self._get_frame(self.angle)
+        
+        # Collision masks of the rotated image, keyed by angle
+        self._masks = {}
+        self.max_cached_masks = 360
 
         # Movement flags; start with a ship that's not moving.
         self.moving_forward = False
         self.moving_backward = False
         self.rotating_right = False
         self.rotating_left = False
+        
+        # Respawn state, counted in simulation ticks: first a countdown that
+        # holds the game, then a spell of invulnerability while the ship blinks.
+        self.respawn_ticks = 0
+        self.invulnerable_ticks = 0
+        self.blink_ticks = 8  # Ticks the ship stays shown or hidden while blinking
     
     def update(self):
         """Update the ship's position based on movement flag."""
+        # Remember where the ship was for interpolated drawing
+        self.prev_x = self.x
+        self.prev_y = self.y
+        
+        if self.invulnerable_ticks:
+            self.invulnerable_ticks -= 1
+
         # Handle rotation
         if self.rotating_right:
             self.angle += self.settings.ship_rotation_speed
@@ -67,27 +97,98 @@ class Ship:
             self.y += speed * math.sin(radians)
 
             # Wrap around screen edges (classic Asteroids behavior)
+            wrapped = True
             if self.x < 0:
                 self.x = self.settings.screen_width
             elif self.x > self.settings.screen_width:
                 self.x = 0
+            elif 0 <= self.y <= self.settings.screen_height:
+                wrapped = False
                 
             if self.y < 0:
                 self.y = self.settings.screen_height
             elif self.y > self.settings.screen_height:
                 self.y = 0
+
+            # Don't interpolate across the whole screen after wrapping around
+            if wrapped:
+                self.prev_x = self.x
+                self.prev_y = self.y
         
+        # Swap in the rotated image only when the angle changed
+        if self.angle != self._image_angle:
+            self._image_angle = self.angle
+            self.image = self._get_frame(self.angle)
+            self.rect.size = self.image.get_size()
+
         # Update rect position
-        self.rect.centerx = self.x
-        self.rect.centery = self.y
+        self.rect.center = (self.x, self.y)
 
         # Update collision rect to stay centered with the ship
         self.collision_rect.center = (self.x, self.y)
 
-        # Rotate the image
-        self.image = pygame.transform.rotate(self.original_image, -self.angle)
-        self.rect = self.image.get_rect(center=(self.x, self.y))
+    def _prerotate(self):
+        """Rotate the image to every angle the rotation speed can reach.
+
+        With a speed that divides 360 (2.5 degrees gives 144 angles) the
+        whole table is built up front; other speeds fill it as angles come up.
+        """
+        step = self.settings.ship_rotation_speed
+        if step <= 0:
+            return
+        count = 360 / step
+        if count != int(count) or count > self.max_cached_frames:
+            return
+        for index in range(int(count)):
+            self._get_frame((index * step) % 360)
+
+    def _get_frame(self, angle):
+        """Return the image rotated to angle, rotating it on first use."""
+        image = self._frames.get(angle)
+        if image is None:
+            if len(self._frames) >= self.max_cached_frames:
+                self._frames.clear()  # Odd rotation speeds can reach any angle
+            image = self._frames[angle] = pygame.transform.rotate(self.original_image, -angle)
+        return image
+
+    def get_mask(self):
+        """Return the collision mask of the ship's current rotated image."""
+        mask = self._masks.get(self.angle)
+        if mask is None:
+            if len(self._masks) >= self.max_cached_masks:
+                self._masks.clear()  # Odd rotation speeds can reach any angle
+            mask = self._masks[self.angle] = pygame.mask.from_surface(self.image)
+        return mask
+
+    def center_ship(self):
+        """Center the ship on the screen."""
+        self.rect.center = self.screen_rect.center
+        self.x = float(self.rect.centerx)
+        self.y = float(self.rect.centery)
+        self.prev_x = self.x
+        self.prev_y = self.y
+
+    def respawn(self, countdown_ticks=0, invulnerable_ticks=0):
+        """Stop and center the ship, then hold the game for countdown_ticks and
+        keep the ship invulnerable for invulnerable_ticks after that."""
+        self.center_ship()
+        self.moving_forward = False
+        self.moving_backward = False
+        self.rotating_left = False
+        self.rotating_right = False
+        self.respawn_ticks = countdown_ticks
+        self.invulnerable_ticks = invulnerable_ticks
+
+    def is_invulnerable(self):
+        """Check if rocks can't hit the ship right now."""
+        return self.respawn_ticks > 0 or self.invulnerable_ticks > 0
+
+    def is_shown(self):
+        """Check if the ship should be drawn this frame (it blinks while invulnerable)."""
+        if self.respawn_ticks or not self.invulnerable_ticks:
+            return True
+        return (self.invulnerable_ticks // self.blink_ticks) % 2 == 0
 
     def blitme(self):
-        """Draw the ship at its current location."""
-        self.screen.blit(self.image, self.rect)
\ No newline at end of file
+        """Draw the ship at its current location and return the area drawn."""
+        return self.screen.blit(self.image, self.rect)
\ No newline at end of file
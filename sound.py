@@ -0,0 +1,195 @@
+"""
+SoundBank class to play the game's sound effects without delays.
+This module decodes (or synthesizes) every effect once at startup and plays
+them through a fixed pool of mixer channels, where more important effects
+take over the channels of less important ones when all are busy.
+"""
+
+import math
+import os
+import random
+from array import array
+
+import pygame
+
+from event_log import WARNING
+
+# Effect name -> (priority, most channels it may use at once, volume)
+EFFECTS = {
+    'ship_hit': (3, 1, 1.0),
+    'level_up': (2, 1, 0.8),
+    'rock_destroyed': (1, 3, 0.7),
+    'rock_escaped': (1, 2, 0.5),
+    'fire': (0, 2, 0.4)
+}
+
+
+def init_mixer(frequency=22050, buffer=512):
+    """Start the mixer with a small buffer for low latency; return False if there's no audio device."""
+    if pygame.mixer.get_init() is not None:
+        return True
+    pygame.mixer.pre_init(frequency, -16, 1, buffer)
+    try:
+        pygame.mixer.init()
+    except pygame.error:
+        return False
+    return True
+
+
+class _Voice:
+    """One mixer channel of the pool and the effect it last started."""
+
+    __slots__ = ('channel', 'effect', 'priority', 'started')
+
+    def __init__(self, channel):
+        """Wrap an idle channel."""
+        self.channel = channel
+        self.effect = None
+        self.priority = -1
+        self.started = 0
+
+
+class SoundBank:
+    """Sound effects held in memory and played through a bounded channel pool."""
+
+    def __init__(self, channels=8, volume=0.6, sound_dir='sounds', events=None):
+        """Load every effect in EFFECTS and reserve channels mixer channels.
+
+        An effect is loaded from sound_dir/<name>.wav or .ogg when the file
+        exists and synthesized otherwise. Without an initialized mixer the
+        bank stays silent and play() does nothing.
+        """
+        self.enabled = pygame.mixer.get_init() is not None
+        self.volume = volume
+        self._sounds = {}
+        self._voices = []
+        self._started = 0
+
+        # Effects that couldn't get a channel, or took one over from another effect
+        self.dropped = 0
+        self.stolen = 0
+
+        if not self.enabled:
+            return
+        pygame.mixer.set_num_channels(channels)
+        self._voices = [_Voice(pygame.mixer.Channel(index)) for index in range(channels)]
+        for name in EFFECTS:
+            self._sounds[name] = self._load(name, sound_dir, events)
+        self.set_volume(volume)
+
+    def play(self, name):
+        """Start the effect name right away on a channel of the pool.
+
+        The effect restarts its oldest copy when it already uses all the
+        channels it may, takes a free channel otherwise, and else takes over
+        the channel of the oldest lower-priority effect. If every channel
+        plays something as important, the effect is dropped.
+        """
+        if not self.enabled:
+            return
+        priority, max_voices, _ = EFFECTS[name]
+        free = None
+        victim = None
+        oldest_copy = None
+        copies = 0
+        for voice in self._voices:
+            if not voice.channel.get_busy():
+                if free is None:
+                    free = voice
+                continue
+            if voice.effect == name:
+                copies += 1
+                if oldest_copy is None or voice.started < oldest_copy.started:
+                    oldest_copy = voice
+            if voice.priority < priority and (
+                    victim is None or voice.priority < victim.priority or
+                    (voice.priority == victim.priority and voice.started < victim.started)):
+                victim = voice
+
+        if copies >= max_voices:
+            voice = oldest_copy
+        elif free is not None:
+            voice = free
+        elif victim is not None:
+            voice = victim
+            self.stolen += 1
+        else:
+            self.dropped += 1
+            return
+
+        self._started += 1
+        voice.effect = name
+        voice.priority = priority
+        voice.started = self._started
+        voice.channel.play(self._sounds[name])
+
+    def set_volume(self, volume):
+        """Set the master volume (0.0 - 1.0) of every effect."""
+        self.volume = volume
+        for name, sound in self._sounds.items():
+            sound.set_volume(volume * EFFECTS[name][2])
+
+    def stop(self):
+        """Stop every effect that is playing."""
+        for voice in self._voices:
+            voice.channel.stop()
+
+    def _load(self, name, sound_dir, events):
+        """Return the effect name, from its file in sound_dir or synthesized."""
+        for extension in ('.wav', '.ogg'):
+            path = os.path.join(sound_dir, name + extension)
+            if os.path.exists(path):
+                try:
+                    return pygame.mixer.Sound(path)
+                except pygame.error as e:
+                    if events is not None:
+                        events.log('sound_load_failed', level=WARNING, path=path, error=str(e))
+        return self._synthesize(name)
+
+    def _synthesize(self, name):
+        """Build the effect name from generated 16 bit samples in the mixer's format."""
+        frequency, _, channels = pygame.mixer.get_init()
+        noise = random.Random(name)  # Same noise every run, without touching the game's generator
+
+        if name == 'fire':
+            # Short blip sliding down from 880 Hz to 440 Hz
+            samples = _sweep(frequency, 0.08, 880, 440, square=True)
+        elif name == 'rock_destroyed':
+            # Burst of noise fading out
+            count = int(frequency * 0.25)
+            samples = [noise.uniform(-1, 1) * (1 - i / count) ** 2 for i in range(count)]
+        elif name == 'rock_escaped':
+            # Low tone sliding down
+            samples = _sweep(frequency, 0.2, 220, 110)
+        elif name == 'ship_hit':
+            # Rumble of noise over a low tone
+            count = int(frequency * 0.6)
+            samples = [(0.6 * noise.uniform(-1, 1) + 0.4 * math.sin(2 * math.pi * 70 * i / frequency))
+                       * (1 - i / count) for i in range(count)]
+        else:
+            # Rising arpeggio
+            samples = []
+            for note in (523.25, 659.25, 783.99):
+                samples.extend(_sweep(frequency, 0.12, note, note))
+
+        # Every sample above is within -1..1
+        pcm = [int(sample * 32000) for sample in samples]
+        if channels > 1:
+            pcm = [value for value in pcm for _ in range(channels)]
+        return pygame.mixer.Sound(buffer=array('h', pcm).tobytes())
+
+
+def _sweep(frequency, seconds, start_hz, end_hz, square=False):
+    """Return samples of a tone gliding from start_hz to end_hz, with a short fade out."""
+    count = int(frequency * seconds)
+    fade = max(1, count // 5)
+    samples = []
+    phase = 0.0
+    for i in range(count):
+        hz = start_hz + (end_hz - start_hz) * i / count
+        phase += 2 * math.pi * hz / frequency
+        value = math.sin(phase)
+        if square:
+            value = 0.5 if value >= 0 else -0.5
+        samples.append(value * min(1.0, (count - i) / fade))
+    return samples
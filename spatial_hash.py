@@ -0,0 +1,60 @@
+"""
+SpatialHash class for the collision broad phase.
+This module buckets rects into a uniform grid so collision checks only test
+objects that share a grid cell instead of every pair.
+"""
+
+
+class SpatialHash:
+    """A uniform grid that indexes items by the cells their rects overlap."""
+
+    def __init__(self, cell_size):
+        """Initialize an empty grid with square cells of cell_size pixels."""
+        self.cell_size = cell_size
+        self._cells = {}
+        self._order = {}  # Item -> insertion order
+        self._removed = set()
+
+    def clear(self):
+        """Remove every item from the grid."""
+        self._cells.clear()
+        self._order.clear()
+        self._removed.clear()
+
+    def insert(self, item, rect):
+        """Index item under every cell overlapped by rect."""
+        self._order[item] = len(self._order)
+        cells = self._cells
+        for cell in self._cells_for(rect):
+            bucket = cells.get(cell)
+            if bucket is None:
+                cells[cell] = [item]
+            else:
+                bucket.append(item)
+
+    def discard(self, item):
+        """Stop returning item from queries without rebuilding the grid."""
+        self._removed.add(item)
+
+    def query(self, rect):
+        """Return the items that may overlap rect, in insertion order."""
+        cells = self._cells
+        candidates = set()
+        for cell in self._cells_for(rect):
+            bucket = cells.get(cell)
+            if bucket:
+                candidates.update(bucket)
+        if self._removed:
+            candidates -= self._removed
+        if len(candidates) > 1:
+            return sorted(candidates, key=self._order.__getitem__)
+        return list(candidates)
+
+    def _cells_for(self, rect):
+        """Yield the grid cells overlapped by rect (negative sizes are normalized)."""
+        size = self.cell_size
+        left, right = sorted((rect.left, rect.right))
+        top, bottom = sorted((rect.top, rect.bottom))
+        for cell_x in range(left // size, right // size + 1):
+            for cell_y in range(top // size, bottom // size + 1):
+                yield (cell_x, cell_y)
@@ -0,0 +1,126 @@
+"""
+SpawnScheduler class to decide when rocks spawn and build them ahead of time.
+This module releases rocks at a steady rate plus optional waves and bursts,
+and keeps a short queue of rocks already randomized and drawn, prepared in
+the idle time at the end of a frame, so a spawn only has to dequeue one.
+"""
+
+import time
+from collections import deque
+
+
+class SpawnScheduler:
+    """Rock spawn timing and a queue of rocks prepared ahead of time."""
+
+    def __init__(self, ai_game):
+        """Initialize the scheduler for the game's rock pool."""
+        self.ai_game = ai_game
+        self.settings = ai_game.settings
+        self.pool = ai_game.rock_pool
+
+        # Rocks taken from the pool and randomized, waiting to be launched
+        self._ready = deque()
+
+        # Spawn timing, counted in simulation ticks
+        self.timer = 0  # Since the last steady spawn
+        self.wave_timer = 0  # Since the last wave started
+        self.wave_left = 0  # Rocks of the current wave not yet released
+        self.wave_gap = 0  # Ticks until the wave's next rock
+        self.owed = 0  # Spawns due but held back by rock_spawn_max_per_tick
+
+        # Rocks prepared in idle time, built during a tick because the queue
+        # was empty, and wave rocks dropped because the screen was full
+        self.prepared = 0
+        self.built_on_demand = 0
+        self.dropped = 0
+
+    def reset(self):
+        """Return the prepared rocks to the pool and restart the timers for a new game.
+
+        Prepared rocks were randomized with the previous game's generator,
+        so keeping them would break replays.
+        """
+        self.pool.release_all(self._ready)
+        self._ready.clear()
+        self.timer = 0
+        self.wave_timer = 0
+        self.wave_left = 0
+        self.wave_gap = 0
+        self.owed = 0
+
+    def prepare(self, budget):
+        """Fill the queue of ready rocks for at most budget seconds; return how many were built."""
+        ready = self._ready
+        size = self.settings.rock_spawn_queue_size
+        deadline = time.perf_counter() + budget
+        built = 0
+        while len(ready) < size and time.perf_counter() < deadline:
+            ready.append(self._build())
+            built += 1
+        self.prepared += built
+        return built
+
+    def update(self):
+        """Advance the spawn timers by one tick and return the rocks to launch now."""
+        settings = self.settings
+        rocks_on_screen = len(self.ai_game.rocks)
+
+        # Steady spawns: one rock every rock_spawn_rate ticks while there's room
+        self.timer += 1
+        if self.timer >= settings.rock_spawn_rate and rocks_on_screen < settings.max_rocks:
+            self.owed += 1
+            self.timer = 0
+
+        # Waves: rock_wave_size rocks every rock_wave_interval ticks,
+        # rock_wave_spacing ticks apart (0 releases the whole wave at once)
+        if settings.rock_wave_interval:
+            self.wave_timer += 1
+            if self.wave_timer >= settings.rock_wave_interval:
+                self.wave_timer = 0
+                self.wave_left += settings.rock_wave_size
+                self.wave_gap = 0
+            if self.wave_left:
+                if self.wave_gap > 0:
+                    self.wave_gap -= 1
+                else:
+                    released = self.wave_left if settings.rock_wave_spacing == 0 else 1
+                    self.owed += released
+                    self.wave_left -= released
+                    # The gap counts down from the next tick, so spacing N
+                    # releases the following rock N ticks after this one
+                    self.wave_gap = max(0, settings.rock_wave_spacing - 1)
+
+        if not self.owed:
+            return ()
+
+        # Bound the work of a single tick; what's left spawns in the next ones
+        count = min(self.owed, settings.rock_spawn_max_per_tick)
+        self.owed -= count
+        room = max(0, settings.max_rocks - rocks_on_screen)
+        if count > room:
+            self.dropped += count - room
+            count = room
+        return [self._next_rock() for _ in range(count)]
+
+    def _next_rock(self):
+        """Return a prepared rock, building one if the queue is empty."""
+        if self._ready:
+            return self._ready.popleft()
+        self.built_on_demand += 1
+        return self._build()
+
+    def _build(self):
+        """Take a rock from the pool, randomized, with its frame and mask cached."""
+        rock = self.pool.acquire()
+        if self.settings.precise_collisions:
+            rock.get_mask()
+        return rock
+
+    def get_metrics(self):
+        """Get a summary of the queue and of where rocks were built."""
+        return {
+            'ready': len(self._ready),
+            'prepared': self.prepared,
+            'built_on_demand': self.built_on_demand,
+            'dropped': self.dropped
+        }
@@ -0,0 +1,146 @@
+"""
+Sprite caches shared by the game's entities.
+This module keeps pre-rotated sprite frames, and the collision masks of those
+frames, so rotating sprites don't have to call pygame.transform.rotate or
+pygame.mask.from_surface on every frame.
+"""
+
+import math
+from collections import OrderedDict
+
+import pygame
+
+
+class RotationStrip:
+    """The rotated frames of one scaled source image."""
+
+    def __init__(self, base_image, frame_count):
+        """Store the scaled base image and prepare empty frame slots."""
+        self.base_image = base_image
+        self.frames = [None] * frame_count
+        self.masks = [None] * frame_count
+        self.bytes_used = _surface_bytes(base_image)
+
+
+class RotationAtlas:
+    """An LRU cache of pre-rotated frames keyed by (image key, scale bucket)."""
+
+    def __init__(self, angle_step=3.0, scale_step=0.05, max_bytes=64 * 1024 * 1024):
+        """Initialize the atlas with its quantization steps and memory budget."""
+        self.angle_step = angle_step
+        self.scale_step = scale_step
+        self.max_bytes = max_bytes
+        self.frame_count = max(1, int(round(360 / angle_step)))
+
+        # Strips ordered from least to most recently used.
+        self._strips = OrderedDict()
+        self.bytes_used = 0
+
+        # Cache statistics
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def quantize_scale(self, scale):
+        """Snap a scale factor to the nearest scale bucket.
+
+        Buckets are spaced by a ratio of 1 + scale_step rather than a fixed
+        amount, so small rocks get as many distinct sizes as large ones.
+        """
+        if not self.scale_step:
+            return scale
+        ratio = 1 + self.scale_step
+        return round(ratio ** round(math.log(scale, ratio)), 6)
+
+    def quantize_angle(self, angle):
+        """Return the frame index for an angle in degrees."""
+        return int(round(angle / self.angle_step)) % self.frame_count
+
+    def get_frame(self, image, image_key, scale, angle):
+        """Return the rotated frame of image at the given scale and angle.
+
+        The scale must already be quantized with quantize_scale so that every
+        caller with the same bucket shares one strip.
+        """
+        key = (image_key, scale)
+        strip = self._strips.get(key)
+        if strip is None:
+            strip = self._add_strip(key, image, scale)
+        else:
+            self._strips.move_to_end(key)
+
+        index = self.quantize_angle(angle)
+        frame = strip.frames[index]
+        if frame is None:
+            self.misses += 1
+            frame = pygame.transform.rotate(strip.base_image, index * self.angle_step)
+            strip.frames[index] = frame
+            frame_bytes = _surface_bytes(frame)
+            strip.bytes_used += frame_bytes
+            self.bytes_used += frame_bytes
+            self._evict(keep=key)
+        else:
+            self.hits += 1
+        return frame
+
+    def get_mask(self, image, image_key, scale, angle):
+        """Return the collision mask of the frame get_frame returns for the same arguments."""
+        frame = self.get_frame(image, image_key, scale, angle)
+        strip = self._strips[(image_key, scale)]
+        index = self.quantize_angle(angle)
+        mask = strip.masks[index]
+        if mask is None:
+            mask = pygame.mask.from_surface(frame)
+            strip.masks[index] = mask
+            mask_bytes = _mask_bytes(mask)
+            strip.bytes_used += mask_bytes
+            self.bytes_used += mask_bytes
+            self._evict(keep=(image_key, scale))
+        return mask
+
+    def get_base_image(self, image, image_key, scale):
+        """Return the scaled, unrotated image for an image key and scale bucket."""
+        key = (image_key, scale)
+        strip = self._strips.get(key)
+        if strip is None:
+            strip = self._add_strip(key, image, scale)
+        return strip.base_image
+
+    def clear(self):
+        """Drop every cached strip."""
+        self._strips.clear()
+        self.bytes_used = 0
+
+    def _add_strip(self, key, image, scale):
+        """Scale the source image once and register a new strip for it."""
+        width = max(1, int(image.get_width() * scale))
+        height = max(1, int(image.get_height() * scale))
+        base_image = pygame.transform.scale(image, (width, height))
+        strip = RotationStrip(base_image, self.frame_count)
+        self._strips[key] = strip
+        self.bytes_used += strip.bytes_used
+        self._evict(keep=key)
+        return strip
+
+    def _evict(self, keep):
+        """Evict least recently used strips until the atlas fits its budget."""
+        while self.bytes_used > self.max_bytes and len(self._strips) > 1:
+            key, strip = next(iter(self._strips.items()))
+            if key == keep:
+                # Never evict the strip that is being filled right now.
+                self._strips.move_to_end(key)
+                continue
+            del self._strips[key]
+            self.bytes_used -= strip.bytes_used
+            self.evictions += 1
+
+
+def _surface_bytes(surface):
+    """Approximate the pixel memory held by a surface."""
+    return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+
+def _mask_bytes(mask):
+    """Approximate the memory held by a mask (one bit per pixel)."""
+    width, height = mask.get_size()
+    return width * height // 8
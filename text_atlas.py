@@ -0,0 +1,59 @@
+"""
+GlyphAtlas class to draw numeric text without rasterizing fonts every frame.
+This module pre-renders the digits, punctuation and label prefixes of one
+font and color once, and composes strings such as "Tiempo: 42s" by blitting
+the cached glyphs side by side.
+"""
+
+import pygame
+
+# Characters every atlas renders up front
+DEFAULT_GLYPHS = "0123456789.,:-+%/s "
+
+
+class GlyphAtlas:
+    """Pre-rendered glyphs and labels of one font and color."""
+
+    def __init__(self, font, color, glyphs=DEFAULT_GLYPHS):
+        """Render every glyph once."""
+        self.font = font
+        self.color = color
+        self.height = font.get_height()
+        self._glyphs = {char: font.render(char, True, color) for char in glyphs}
+        self._labels = {}  # Label prefix -> rendered image, filled on first use
+
+        # Strings that needed a character missing from the atlas
+        self.fallbacks = 0
+
+    def render(self, text, label=''):
+        """Return an image of label followed by text.
+
+        The label is rendered once and cached; text is composed from the
+        glyphs. Text with a character missing from the atlas is rendered
+        with the font instead.
+        """
+        glyphs = self._glyphs
+        for char in text:
+            if char not in glyphs:
+                self.fallbacks += 1
+                return self.font.render(label + text, True, self.color)
+
+        # Lay out the label and glyphs side by side
+        sequence = []
+        x = 0
+        if label:
+            label_image = self._labels.get(label)
+            if label_image is None:
+                label_image = self._labels[label] = self.font.render(label, True, self.color)
+            sequence.append((label_image, (0, 0), None, pygame.BLEND_RGBA_MAX))
+            x = label_image.get_width()
+        for char in text:
+            glyph = glyphs[char]
+            sequence.append((glyph, (x, 0), None, pygame.BLEND_RGBA_MAX))
+            x += glyph.get_width()
+
+        # Glyphs never overlap, so BLEND_RGBA_MAX copies their pixels onto the
+        # transparent image exactly instead of blending them with it
+        image = pygame.Surface((x, self.height), pygame.SRCALPHA)
+        image.blits(sequence, doreturn=False)
+        return image